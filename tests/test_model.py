@@ -1,11 +1,15 @@
 
+import os
+import tempfile
 import unittest
 from copy import deepcopy
+from unittest import mock
 
 from jsonpickle import decode
 
+from xlcalculator import model
 from xlcalculator.model import Model, ModelCompiler
-from xlcalculator.xltypes import XLCell, XLFormula, XLRange
+from xlcalculator.xltypes import XLCell, XLFormula, XLRange, XLTable
 from xlcalculator.tokenizer import f_token
 from xlcalculator import Evaluator
 
@@ -44,6 +48,79 @@ class ModelTest(testing.XlCalculatorTestCase):
 
         self.assertEqual(self.model, this_model)
 
+    def test_build_code_parallel(self):
+        this_model = deepcopy(self.model)
+        this_model.build_code(max_workers=2)
+
+        for cell in this_model.cells.values():
+            if cell.formula is not None:
+                self.assertIsNotNone(cell.formula.ast)
+
+        evaluator = Evaluator(this_model)
+        self.assertEqual(101, evaluator.evaluate('Ninth!B1'))
+
+    def test_set_formula_cache_size(self):
+        try:
+            model.set_formula_cache_size(1)
+            this_model = deepcopy(self.model)
+            this_model.build_code()
+
+            stats = model.get_formula_cache_stats()
+            self.assertEqual(1, stats['cache_info']['maxsize'])
+            self.assertEqual(1, stats['cache_info']['currsize'])
+            self.assertTrue(stats['cache_info']['misses'] > 1)
+        finally:
+            model.set_formula_cache_size(model.FORMULA_CACHE_SIZE)
+
+    def test_formula_cache_size_from_env(self):
+        with mock.patch.dict(os.environ, {'XLCALC_AST_CACHE': '5'}):
+            self.assertEqual(5, model._formula_cache_size_from_env())
+        with mock.patch.dict(os.environ, {'XLCALC_AST_CACHE': 'many'}):
+            with self.assertLogs(level='WARNING'):
+                self.assertEqual(
+                    10000, model._formula_cache_size_from_env())
+
+    def test_eq(self):
+        this_model = deepcopy(self.model)
+        self.assertEqual(self.model, this_model)
+
+        # Models with different cells are not equal, whichever side has
+        # the extra cell.
+        this_model.set_cell_value('Sheet1!A1', 88)
+        self.assertNotEqual(self.model, this_model)
+        self.assertNotEqual(this_model, self.model)
+
+    def test_persist_and_construct_from_json_file(self):
+        for suffix in ('.json', '.json.gz'):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                fname = os.path.join(tmp_dir, 'model' + suffix)
+                self.model.persist_to_json_file(fname)
+
+                new_model = Model()
+                new_model.construct_from_json_file(fname)
+
+            self.assertEqual(self.model, new_model)
+            self.assertEqual(self.model.formulae, new_model.formulae)
+            self.assertEqual(self.model.ranges, new_model.ranges)
+
+    def test_persist_and_construct_from_file(self):
+        for suffix in ('.pickle', '.pickle.gz'):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                fname = os.path.join(tmp_dir, 'model' + suffix)
+                self.model.persist_to_file(fname)
+
+                new_model = Model()
+                new_model.construct_from_file(fname)
+
+            self.assertEqual(self.model, new_model)
+            self.assertEqual(self.model.formulae, new_model.formulae)
+            self.assertEqual(self.model.ranges, new_model.ranges)
+
+    def test_construct_from_file_with_json(self):
+        new_model = Model()
+        new_model.construct_from_file(testing.get_resource("model.json"))
+        self.assertEqual(self.model, new_model)
+
     def test_set_value(self):
         this_model = deepcopy(self.model)
 
@@ -71,6 +148,19 @@ class ModelTest(testing.XlCalculatorTestCase):
         cell_value_01 = 0.1
         self.assertEqual(cell_value_01, this_model.cells['Sheet1!A1'].value)
 
+        this_model.set_cell_value(XLCell('Sheet1!B1', 22), 0.2)
+        self.assertIsInstance(this_model.cells['Sheet1!B1'], XLCell)
+        self.assertEqual(0.2, this_model.cells['Sheet1!B1'].value)
+
+        # Mutable values are copied.
+        value = [1, 2]
+        this_model.set_cell_value('Sheet1!C1', value)
+        self.assertEqual(value, this_model.cells['Sheet1!C1'].value)
+        self.assertIsNot(value, this_model.cells['Sheet1!C1'].value)
+
+        this_model.set_cell_value(XLCell('Sheet1!C1', 22), value)
+        self.assertIsNot(value, this_model.cells['Sheet1!C1'].value)
+
     def test_get_value(self):
         this_model = deepcopy(self.model)
 
@@ -97,6 +187,22 @@ class ModelTest(testing.XlCalculatorTestCase):
         cell_value_04 = 0
         self.assertEqual(cell_value_04, get_cell_value_04)
 
+    def test_cell_subclass_address(self):
+        class MyCell(XLCell):
+            pass
+
+        this_model = deepcopy(self.model)
+        self.assertEqual(
+            this_model.get_cell_value(MyCell('First!A2', 22)), 0.1)
+        this_model.set_cell_value(MyCell('First!A2', 22), 0.5)
+        self.assertEqual(this_model.get_cell_value('First!A2'), 0.5)
+
+    def test_bad_address_type(self):
+        with self.assertRaises(TypeError):
+            self.model.get_cell_value(1)
+        with self.assertRaises(TypeError):
+            self.model.set_cell_value(1, 88)
+
 
 class ModelCompilerTest(unittest.TestCase):
     maxDiff = None
@@ -177,6 +283,47 @@ class ModelCompilerTest(unittest.TestCase):
 
         self.assertEqual(self.model.ranges, model_compiler.model.ranges)
 
+    def test_build_ranges_with_tables(self):
+        class Column:
+            def __init__(self, name):
+                self.name = name
+
+        model_compiler = ModelCompiler()
+        model_compiler.model.tables = {
+            'T': XLTable(
+                name='T', sheet='Sheet1', cell_range='A1:B4',
+                columns=[Column('a'), Column('b')], header_row_count=1)
+        }
+        for address, text in (
+                ('Sheet1!D2', '=SUM(T[b])'),
+                ('Sheet1!D3', '=SUM(T[b])+1'),
+                ('Sheet1!E2', '=T[[#This Row],[a]]'),
+                ('Sheet1!E3', '=T[[#This Row],[a]]')):
+            formula = XLFormula(text, sheet_name='Sheet1', reference=address)
+            model_compiler.model.formulae[address] = formula
+            model_compiler.model.cells[address] = XLCell(
+                address, None, formula=formula)
+        model_compiler.build_ranges()
+
+        formulae = model_compiler.model.formulae
+        column_b = {'Sheet1!B2', 'Sheet1!B3', 'Sheet1!B4'}
+        self.assertEqual(column_b, formulae['Sheet1!D2'].associated_cells)
+        self.assertEqual(column_b, formulae['Sheet1!D3'].associated_cells)
+        self.assertEqual({'Sheet1!A2'}, formulae['Sheet1!E2'].associated_cells)
+        self.assertEqual({'Sheet1!A3'}, formulae['Sheet1!E3'].associated_cells)
+
+    def test_build_code_with_defined_names(self):
+        model_compiler = ModelCompiler()
+        model = model_compiler.read_and_parse_archive(
+            testing.get_resource("reader.xlsm"), ignore_sheets=['Eleventh'])
+        formula = XLFormula('=SUM(My_Range)+Hundred', sheet_name='Ninth')
+        model.cells['Ninth!Z9'] = XLCell('Ninth!Z9', None, formula=formula)
+        model.build_code()
+
+        evaluator = Evaluator(model)
+        self.assertEqual(155, evaluator.evaluate('Ninth!Z9'))
+        self.assertEqual(101, evaluator.evaluate('Ninth!B1'))
+
     def test_extract_cells(self):
         model_compiler = ModelCompiler()
         reader_model = model_compiler.read_and_parse_archive(
@@ -272,6 +419,10 @@ class ModelCompilerTest(unittest.TestCase):
         evaluator.evaluate('add_one')
         self.assertEqual(3, extracted_model.get_cell_value('Sheet1!B1'))
 
+        # The source model is left untouched.
+        self.assertEqual(1, reader_model.get_cell_value('Sheet1!A1'))
+        self.assertEqual(2, reader_model.get_cell_value('Sheet1!B1'))
+
     def test_dict_read_and_parse(self):
 
         input_dict = {
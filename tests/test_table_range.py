@@ -1,5 +1,11 @@
 from . import testing
-from xlcalculator.utils import resolve_table_ranges
+from xlcalculator.utils import (
+    ColumnNotFoundError,
+    TableNotFoundError,
+    _translate_table_name,
+    build_table_name_index,
+    resolve_table_ranges,
+)
 from xlcalculator.xltypes import XLTable
 
 # Dummy column class for our ExcelTableColumn
@@ -80,6 +86,128 @@ class TableRangeTest(testing.XlCalculatorTestCase):
         result = resolve_table_ranges("MyTable[[#Headers],[Col1]:[Col3]]", self.tables)
         self.assertEqual(result, "Sheet1!A1:C1")
 
+    def test_repeated_reference_with_other_tables(self):
+        # The parsed reference is cached, the table lookup is not.
+        result = resolve_table_ranges("MyTable[Col2]", self.tables)
+        self.assertEqual(result, "Sheet1!B2:B5")
+
+        moved_table = XLTable(
+            name="MyTable",
+            sheet="Sheet2",
+            cell_range="D3:F9",
+            columns=[
+                DummyColumn("Col1"), DummyColumn("Col2"), DummyColumn("Col3")],
+            header_row_count=1
+        )
+        result = resolve_table_ranges(
+            "MyTable[Col2]", {"MyTable": moved_table})
+        self.assertEqual(result, "Sheet2!E4:E9")
+
+    def _suffixed_table(self, sheet):
+        return XLTable(
+            name="MyTable",
+            sheet=sheet,
+            cell_range="A1:C5",
+            columns=[
+                DummyColumn("Col1"), DummyColumn("Col2"), DummyColumn("Col3")],
+            header_row_count=1
+        )
+
+    def test_table_name_with_sheet_suffix(self):
+        tables = {"MyTable_Sheet2": self._suffixed_table("Sheet2")}
+        table_names = {}
+        for _ in range(2):
+            result = resolve_table_ranges(
+                "MyTable[Col3]", tables, table_names=table_names)
+            self.assertEqual(result, "Sheet2!C2:C5")
+        self.assertEqual(table_names, {"MyTable": "MyTable_Sheet2"})
+
+        # Without an index, the tables are scanned.
+        result = resolve_table_ranges("MyTable[Col3]", tables)
+        self.assertEqual(result, "Sheet2!C2:C5")
+
+        with self.assertRaises(TableNotFoundError):
+            resolve_table_ranges("OtherTable[Col3]", tables)
+
+    def test_table_name_index_refresh(self):
+        tables = {
+            "MyTable_Sheet2": self._suffixed_table("Sheet2"),
+            "MyTable_Sheet3": self._suffixed_table("Sheet3"),
+        }
+        table_names = build_table_name_index(tables)
+        self.assertEqual(
+            _translate_table_name("MyTable", tables, table_names),
+            "MyTable_Sheet2")
+
+        # A stale entry is detected on a hit and the index rebuilt.
+        tables["MyTable_Sheet2"].sheet = "Other"
+        self.assertEqual(
+            _translate_table_name("MyTable", tables, table_names),
+            "MyTable_Sheet3")
+        self.assertEqual(table_names, {"MyTable": "MyTable_Sheet3"})
+
+        # A miss rebuilds the index before giving up.
+        tables["NewTable_Sheet1"] = XLTable(
+            name="NewTable", sheet="Sheet1", cell_range="A1:A2",
+            columns=[DummyColumn("Col1")], header_row_count=1)
+        self.assertEqual(
+            _translate_table_name("NewTable", tables, table_names),
+            "NewTable_Sheet1")
+        del tables["MyTable_Sheet3"]
+        with self.assertRaises(TableNotFoundError):
+            _translate_table_name("MyTable", tables, table_names)
+        self.assertEqual(table_names, {"NewTable": "NewTable_Sheet1"})
+
+    def test_duplicate_column_names(self):
+        tables = {
+            "DupTable": XLTable(
+                name="DupTable",
+                sheet="Sheet1",
+                cell_range="B1:E5",
+                columns=[
+                    DummyColumn("Col"), DummyColumn("Col"),
+                    DummyColumn("Other")],
+                header_row_count=1
+            )
+        }
+        self.assertEqual(
+            resolve_table_ranges("DupTable[Col]", tables), "Sheet1!B2:B5")
+        self.assertEqual(
+            resolve_table_ranges("DupTable[Col_2]", tables), "Sheet1!C2:C5")
+        self.assertEqual(
+            resolve_table_ranges("DupTable[[Col_2]:[Other]]", tables),
+            "Sheet1!C2:D5")
+
+    def test_column_changes(self):
+        # The column lookup is cached per table but follows column changes.
+        table = XLTable(
+            name="ColTable",
+            sheet="Sheet1",
+            cell_range="B1:E5",
+            columns=[DummyColumn("Col"), DummyColumn("Other")],
+            header_row_count=1
+        )
+        tables = {"ColTable": table}
+        self.assertEqual(
+            resolve_table_ranges("ColTable[Other]", tables), "Sheet1!C2:C5")
+
+        # Replacing the columns list.
+        table.columns = [DummyColumn("Other"), DummyColumn("Col")]
+        self.assertEqual(
+            resolve_table_ranges("ColTable[Other]", tables), "Sheet1!B2:B5")
+
+        # Renaming a column in place.
+        table.columns[0].name = "Renamed"
+        self.assertEqual(
+            resolve_table_ranges("ColTable[Renamed]", tables), "Sheet1!B2:B5")
+        with self.assertRaises(ColumnNotFoundError):
+            resolve_table_ranges("ColTable[Other]", tables)
+
+        # Appending a column.
+        table.columns.append(DummyColumn("New"))
+        self.assertEqual(
+            resolve_table_ranges("ColTable[New]", tables), "Sheet1!D2:D5")
+
     # Edge cases
     # Big challenge is to parse the items correctly when it has special characters such as spaces, brackets, colons, etc.
     def test_with_spaces(self):
@@ -68,6 +68,12 @@ class XLCellTest(unittest.TestCase):
         cell = xltypes.XLCell('Sheet1!A1', 5, 'SUM(A1:B1)')
         self.assertEqual(hash(cell), hash(('Sheet1', 1, 1)))
 
+    def test_new_empty(self):
+        cell = xltypes.XLCell.new_empty('Sheet1!C7')
+        self.assertEqual(cell, xltypes.XLCell('Sheet1!C7', ''))
+        self.assertEqual(
+            vars(cell), vars(xltypes.XLCell('Sheet1!C7', '')))
+
 
 class XLRangeTest(unittest.TestCase):
 
@@ -83,6 +89,22 @@ class XLRangeTest(unittest.TestCase):
              ['Sheet1!A3', 'Sheet1!C3', 'Sheet1!E3']]
         )
 
+    def test_init_with_ragged_rows(self):
+        self.assertEqual(
+            xltypes.XLRange('Sheet1!A1:B2,C2:C3').address,
+            [['Sheet1!A1', 'Sheet1!B1'],
+             ['Sheet1!A2', 'Sheet1!B2', 'Sheet1!C2'],
+             ['Sheet1!C3']]
+        )
+
+    def test_init_with_overlapping_ranges(self):
+        self.assertEqual(
+            xltypes.XLRange('Sheet1!A1:B2,B2:C3,E3').address,
+            [['Sheet1!A1', 'Sheet1!B1'],
+             ['Sheet1!A2', 'Sheet1!B2', 'Sheet1!C2'],
+             ['Sheet1!B3', 'Sheet1!C3', 'Sheet1!E3']]
+        )
+
     def test_init_with_bad_sheet(self):
         # While the sheet name should be quoted, internally, the code often
         # just puts the sheet name in to produce unique keys, so the utility
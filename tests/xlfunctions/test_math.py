@@ -17,6 +17,9 @@ class MathModuleTest(unittest.TestCase):
     def test_ACOS(self):
         self.assertAlmostEqual(math.ACOS(-0.5), 2.094395102)
 
+    def test_ACOS_out_of_bounds(self):
+        self.assertIsInstance(math.ACOS(2), xlerrors.NumExcelError)
+
     def test_ACOSH(self):
         self.assertAlmostEqual(math.ACOSH(1), 0)
         self.assertAlmostEqual(math.ACOSH(10), 2.9932228)
@@ -52,9 +55,42 @@ class MathModuleTest(unittest.TestCase):
         self.assertEqual(math.CEILING(2, 0), 0)
         self.assertIsInstance(math.CEILING(2, -2), xlerrors.NumExcelError)
 
+    def test_CEILING_unit_significance(self):
+        self.assertEqual(math.CEILING(3.2, 1), 4)
+        self.assertEqual(math.CEILING(-3.2, 1), -3)
+        self.assertEqual(math.CEILING(-3.2, -1), -4)
+        self.assertEqual(math.CEILING(0.1 + 0.2 + 0.7, 1), 1)
+
+    def test_CEILING_float_noise(self):
+        self.assertEqual(math.CEILING(0.25, 0.1), 0.3)
+        self.assertEqual(math.CEILING(-0.25, 0.1), -0.2)
+        self.assertEqual(math.CEILING(-0.25, -0.1), -0.3)
+        self.assertEqual(math.CEILING(1.1, 0.1), 1.1)
+
     def test_COS(self):
         self.assertAlmostEqual(math.COS(1.047), 0.5001711)
 
+    def test_COS_array(self):
+        result = math.COS(func_xltypes.Array([[0, pymath.pi], [0, 0]]))
+        self.assertIsInstance(result, func_xltypes.Array)
+        self.assertEqual(result.flat, [1, -1, 1, 1])
+
+    def test_ACOS_array(self):
+        result = math.ACOS(func_xltypes.Array([[1], [2]]))
+        self.assertEqual(result.flat[0], 0)
+        self.assertIsInstance(result.flat[1], xlerrors.NumExcelError)
+
+    def test_ACOS_array_with_errors(self):
+        result = math.ACOS(func_xltypes.Array(
+            [[xlerrors.NaExcelError(), 1], ['bad', 2]]))
+        self.assertIsInstance(result.flat[0], xlerrors.NaExcelError)
+        self.assertEqual(result.flat[1], 0)
+        self.assertIsInstance(result.flat[2], xlerrors.ValueExcelError)
+        self.assertIsInstance(result.flat[3], xlerrors.NumExcelError)
+
+    def test_COS_with_bad_arg(self):
+        self.assertIsInstance(math.COS('bad'), xlerrors.ValueExcelError)
+
     def test_COSH(self):
         self.assertAlmostEqual(math.COSH(4), 27.3082328)
 
@@ -72,6 +108,10 @@ class MathModuleTest(unittest.TestCase):
         self.assertAlmostEqual(math.EXP(1), 2.71828183)
         self.assertAlmostEqual(math.EXP(2), 7.3890561)
 
+    def test_EXP_overflow(self):
+        self.assertIsInstance(math.EXP(1000), xlerrors.NumExcelError)
+        self.assertIsInstance(math.COSH(1000), xlerrors.NumExcelError)
+
     def test_FACT(self):
         self.assertEqual(math.FACT(5), 120)
         self.assertEqual(math.FACT(1.9), 1)
@@ -92,6 +132,11 @@ class MathModuleTest(unittest.TestCase):
         self.assertEqual(math.FLOOR(1.58, 0.1), 1.5)
         self.assertEqual(math.FLOOR(0.234, 0.01), 0.23)
 
+    def test_FLOOR_unit_significance(self):
+        self.assertEqual(math.FLOOR(3.7, 1), 3)
+        self.assertEqual(math.FLOOR(-3.7, 1), -4)
+        self.assertEqual(math.FLOOR(-3.7, -1), -3)
+
     def test_FLOOR_number(self):
         self.assertEqual(math.FLOOR(0, -2), 0)
 
@@ -116,6 +161,10 @@ class MathModuleTest(unittest.TestCase):
     def test_LN(self):
         self.assertEqual(math.LN(2.718281828459045), 1)
 
+    def test_LN_with_non_positive_number(self):
+        self.assertIsInstance(math.LN(0), xlerrors.NumExcelError)
+        self.assertIsInstance(math.LN(-1), xlerrors.NumExcelError)
+
     def test_LN_with_bad_arg(self):
         self.assertIsInstance(math.LN('bad'), xlerrors.ValueExcelError)
 
@@ -130,6 +179,10 @@ class MathModuleTest(unittest.TestCase):
         self.assertEqual(math.LOG10(100000), 5)
         self.assertEqual(math.LOG10(1E+5), 5)
 
+    def test_LOG10_with_non_positive_number(self):
+        self.assertIsInstance(math.LOG10(0), xlerrors.NumExcelError)
+        self.assertIsInstance(math.LOG10(-10), xlerrors.NumExcelError)
+
     def test_MOD(self):
         self.assertEqual(math.MOD(1, 2), 1)
 
@@ -155,6 +208,10 @@ class MathModuleTest(unittest.TestCase):
         self.assertIsInstance(math.POWER('bad', 2), xlerrors.ValueExcelError)
         self.assertIsInstance(math.POWER(10, 'bad'), xlerrors.ValueExcelError)
 
+    def test_POWER_out_of_domain(self):
+        self.assertIsInstance(math.POWER(-8, 0.5), xlerrors.NumExcelError)
+        self.assertIsInstance(math.POWER(0, -1), xlerrors.DivZeroExcelError)
+
     def test_RADIANS(self):
         self.assertAlmostEqual(math.RADIANS(270), 4.712389)
 
@@ -172,6 +229,17 @@ class MathModuleTest(unittest.TestCase):
         self.assertEqual(math.ROUND(0.6), 1)
         self.assertEqual(math.ROUND(1.3), 1)
         self.assertEqual(math.ROUND(1.25, 1), 1.3)
+        self.assertEqual(math.ROUND(1.005, 2), 1.01)
+        self.assertEqual(math.ROUND(-2.5), -3)
+        self.assertEqual(math.ROUND(1250, -2), 1300)
+
+    def test_ROUND_full_precision(self):
+        # Digits beyond the 15th are kept, not cut off before rounding.
+        self.assertEqual(
+            math.ROUND(354525.8247378282, 10), 354525.8247378282)
+        self.assertEqual(
+            math.ROUND(1234567.891234567, 9), 1234567.891234567)
+        self.assertEqual(math.ROUND(1e300, 2), 1e300)
 
     def test_ROUND_with_bad_arg(self):
         self.assertIsInstance(
@@ -183,6 +251,8 @@ class MathModuleTest(unittest.TestCase):
         self.assertEqual(math.ROUNDUP(0.6), 1)
         self.assertEqual(math.ROUNDUP(1.3), 2)
         self.assertEqual(math.ROUNDUP(1.24, 1), 1.3)
+        self.assertEqual(
+            math.ROUNDUP(-887122.4442044501, 8), -887122.44420446)
 
     def test_ROUNDUP_with_bad_arg(self):
         self.assertIsInstance(
@@ -194,6 +264,8 @@ class MathModuleTest(unittest.TestCase):
         self.assertEqual(math.ROUNDDOWN(0.6), 0)
         self.assertEqual(math.ROUNDDOWN(1.3), 1)
         self.assertEqual(math.ROUNDDOWN(1.26, 1), 1.2)
+        self.assertEqual(
+            math.ROUNDDOWN(2.9999999999999996, 0), 2)
 
     def test_ROUNDDOWN_with_bad_arg(self):
         self.assertIsInstance(
@@ -233,6 +305,18 @@ class MathModuleTest(unittest.TestCase):
         self.assertEqual(math.SUM(func_xltypes.Array([[1, 2], [3, 4]])), 10)
         self.assertEqual(math.SUM(1, 2, 3, 4.0), 10.0)
 
+    def test_SUM_exactly_rounded(self):
+        self.assertEqual(math.SUM(0.1, 0.2, 0.3), 0.6)
+        self.assertEqual(math.SUM(1e16, 1.0, -1e16), 1.0)
+
+    def test_SUM_overflow(self):
+        self.assertEqual(math.SUM(1e308, 1e308), float('inf'))
+        self.assertTrue(pymath.isnan(
+            math.SUM(float('inf'), float('-inf')).value))
+
+    def test_SUM_integers(self):
+        self.assertIsInstance(math.SUM(1, 2).value, int)
+
     def test_SUM_with_nonnumbers_in_range(self):
         self.assertEqual(math.SUM(func_xltypes.Array([[1, 'bad'], [3, 4]])), 8)
         self.assertEqual(math.SUM(
@@ -250,6 +334,10 @@ class MathModuleTest(unittest.TestCase):
     def test_SUMIF(self):
         self.assertEqual(math.SUMIF([0, 1, 2], '>=1', [10, 20, 30]), 50)
 
+    def test_SUMIF_mixed_range(self):
+        self.assertEqual(
+            math.SUMIF([0, 'a', 2, 3], '<3', [10, 20, 30, 40]), 40)
+
     def test_SUMIF_text(self):
         self.assertEqual(math.SUMIF(['a', 'b', 'A'], '=a', [10, 20, 30]), 40)
 
@@ -261,6 +349,10 @@ class MathModuleTest(unittest.TestCase):
     def test_SUMIF_unspecified_sum_range(self):
         self.assertEqual(math.SUMIF([0, 1, 2, 3], ">=2"), 5)
 
+    def test_SUMIF_unspecified_mixed_sum_range(self):
+        self.assertEqual(math.SUMIF([1, 'a', 2, 3], "<>2"), 4)
+        self.assertEqual(math.SUMIF([1, 'a', 2, 3], "<>a"), 6)
+
     def test_SUMIF_with_invalid_sum_range(self):
         # In this case, "bad" is converted to a single item array, then
         # filtered to an array where the value is 0, so that the sum is always
@@ -277,6 +369,18 @@ class MathModuleTest(unittest.TestCase):
             70
         )
 
+    def test_SUMIFS_three_criteria(self):
+        self.assertEqual(
+            math.SUMIFS([10, 20, 30, 40],
+                        [0, 1, 2, 3],
+                        ">=1",
+                        ["a", "b", "a", "A"],
+                        "a",
+                        [5, 5, 6, 5],
+                        5),
+            40
+        )
+
     def test_SUMIFS_invalid_criteria(self):
         self.assertIsInstance(
             math.SUMIFS([10, 20, 30], [0, 1, 2], [0, 1], ["a", "b", "a"], "a"),
@@ -296,6 +400,21 @@ class MathModuleTest(unittest.TestCase):
         range2 = func_xltypes.Array([[3], [1], [2]])
         self.assertEqual(math.SUMPRODUCT(range1, range2), 19)
 
+    def test_SUMPRODUCT_multiple_columns(self):
+        range1 = func_xltypes.Array([[1, 2], [3, 4]])
+        range2 = func_xltypes.Array([[5, 6], [7, 8]])
+        self.assertEqual(math.SUMPRODUCT(range1, range2), 70)
+
+    def test_SUMPRODUCT_many_ranges(self):
+        range1 = func_xltypes.Array([[1.0], [2.0], [3.0]])
+        range2 = func_xltypes.Array([[4.0], [5.0], [6.0]])
+        range3 = func_xltypes.Array([[7.0], [8.0], [9.0]])
+        range4 = func_xltypes.Array([[1.0], [0.5], [2.0]])
+        self.assertEqual(
+            math.SUMPRODUCT(range1, range2, range3, range4), 392)
+        # The inputs are left untouched.
+        self.assertEqual(range1.flat, [1.0, 2.0, 3.0])
+
     def test_SUMPRODUCT_ranges_with_different_sizes(self):
         range1 = func_xltypes.Array([[1], [10], [3]])
         range2 = func_xltypes.Array([[3], [3], [1], [2]])
@@ -316,6 +435,14 @@ class MathModuleTest(unittest.TestCase):
         self.assertIsInstance(
             math.SUMPRODUCT(range1, range2), xlerrors.NaExcelError)
 
+    def test_SUMPRODUCT_ranges_with_errors_and_text(self):
+        range1 = func_xltypes.Array([['text'], [10], [3]])
+        range2 = func_xltypes.Array([[3], [xlerrors.DivZeroExcelError()], [1]])
+        self.assertIsInstance(
+            math.SUMPRODUCT(range1, range2), xlerrors.NaExcelError)
+        self.assertIsInstance(
+            math.SUMPRODUCT(range1, range1), xlerrors.ValueExcelError)
+
     def test_SUMPRODUCT_with_single_value(self):
         self.assertEqual(math.SUMPRODUCT(1), 1.0)
 
@@ -328,6 +455,8 @@ class MathModuleTest(unittest.TestCase):
         self.assertEqual(math.TRUNC(0.6), 0)
         self.assertEqual(math.TRUNC(1.3), 1)
         self.assertEqual(math.TRUNC(1.26, 1), 1.2)
+        self.assertEqual(math.TRUNC(-1.26, 1), -1.2)
+        self.assertEqual(math.TRUNC(123.456, -1), 120)
 
     def test_TRUNC_with_bad_arg(self):
         self.assertIsInstance(
@@ -120,3 +120,28 @@ class XlModuleTest(unittest.TestCase):
 
         obj = object()
         self.assertEqual(func(obj), obj)
+
+    def test_validate_args_with_keywords(self):
+
+        @xl.validate_args
+        def func(arg: func_xltypes.XlNumber, other=None):
+            return arg, other
+
+        self.assertEqual(func(arg='1'), (1, None))
+        self.assertEqual(func('1', other='data'), (1, 'data'))
+        with self.assertRaises(TypeError):
+            func(1, 2, 3)
+
+    def test_validate_args_with_leading_arg_and_list(self):
+
+        @xl.validate_args
+        def func(
+            arg: func_xltypes.XlText,
+            *args: typing.List[func_xltypes.XlNumber]
+        ):
+            return (arg,) + args
+
+        self.assertEqual(func(1), ('1',))
+        self.assertEqual(func(1, '2', 'bad', 3), ('1', 2, 3))
+        self.assertIsInstance(
+            func(xlerrors.NaExcelError(), 1), xlerrors.NaExcelError)
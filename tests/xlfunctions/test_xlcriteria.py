@@ -1,5 +1,7 @@
 import unittest
 
+import numpy
+
 from xlcalculator.xlfunctions import xlcriteria
 
 
@@ -31,3 +33,20 @@ class XlCriteriaModuleTest(unittest.TestCase):
         check = xlcriteria.parse_criteria(1)
         self.assertTrue(check(1))
         self.assertFalse(check(2))
+
+    def test_parse_criteria_numeric(self):
+        compare, value = xlcriteria.parse_criteria('>3').numeric
+        self.assertEqual(value, 3.0)
+        self.assertEqual(
+            list(compare(numpy.array([2.0, 3.0, 4.0]), value)),
+            [False, False, True])
+        self.assertIsNotNone(xlcriteria.parse_criteria(1).numeric)
+        self.assertIsNone(xlcriteria.parse_criteria('data').numeric)
+
+    def test_parse_criteria_cached(self):
+        check = xlcriteria.parse_criteria('>3')
+        self.assertIs(xlcriteria.parse_criteria('>3'), check)
+        # Equal values of another type get their own check.
+        self.assertIsNot(
+            xlcriteria.parse_criteria(True), xlcriteria.parse_criteria(1))
+        self.assertFalse(xlcriteria.parse_criteria(True)(1))
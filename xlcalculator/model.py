@@ -1,18 +1,47 @@
 import copy
 import gzip
+import io
+import itertools
 import logging
 import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from functools import lru_cache
 
 import jsonpickle
 
-from . import parser, reader, tokenizer, xltypes
+from . import parser, reader, tokenizer, utils, xltypes
+
+
+# Cell value types that can be stored without copying.
+_IMMUTABLE_TYPES = frozenset(
+    (int, float, str, bool, type(None), bytes, tuple)
+)
+
+
+def _formula_cache_size_from_env(default=10000):
+    value = os.environ.get("XLCALC_AST_CACHE")
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logging.warning(
+            "Ignoring invalid XLCALC_AST_CACHE value %r, using %d.",
+            value, default)
+        return default
+
+
+# Maximum number of parsed ASTs kept by the formula cache. Long running
+# services parsing many different workbooks may want to lower it.
+FORMULA_CACHE_SIZE = _formula_cache_size_from_env()
 
 
 # Define a local cached parser as fallback
-@lru_cache(maxsize=10000)
-def _parse_formula_cached_local(formula_text: str, defined_names_hash: str = ""):
+@lru_cache(maxsize=FORMULA_CACHE_SIZE)
+def _parse_formula_cached_local(formula_text: str, defined_names_key: frozenset = frozenset()):
     """
     Local cached formula parser for xlcalculator module.
 
@@ -21,7 +50,9 @@ def _parse_formula_cached_local(formula_text: str, defined_names_hash: str = "")
 
     Args:
         formula_text: The formula string to parse (e.g., "=SUM(A1:B10)")
-        defined_names_hash: Hash of defined names dict for cache differentiation
+        defined_names_key: Frozenset of (name, address) pairs of the defined names.
+            It is both the cache key and the names handed to the parser, so an AST
+            is never reused for a model whose defined names differ.
 
     Returns:
         Parsed AST object
@@ -32,42 +63,69 @@ def _parse_formula_cached_local(formula_text: str, defined_names_hash: str = "")
         - Scales well with workbook complexity
     """
     try:
-        # For cache efficiency, we'll parse defined_names from the hash
-        # This is a simplified approach - in practice, most formulas don't use defined names
-        defined_names = {}
-        if defined_names_hash and defined_names_hash != "empty":
-            # Could implement defined_names deserialization here if needed
-            # For now, keeping it simple for performance
-            pass
-
-        return parser.FormulaParser().parse(formula_text, defined_names)
+        return parser.FormulaParser().parse(formula_text, dict(defined_names_key))
     except Exception as e:
         logging.warning(f"Formula parsing error for '{formula_text}': {e}")
         raise
 
 
-def _serialize_defined_names(defined_names_dict):
-    """
-    Create a cache-friendly hash from defined names dictionary.
-
-    Args:
-        defined_names_dict: Dictionary of defined names
+def _defined_name_address(defn):
+    """Address a defined name resolves to inside a formula."""
+    if isinstance(defn, xltypes.XLRange):
+        # XLRange.address is the matrix of cells; formulas need the range
+        # address itself so that it is looked up in Model.ranges.
+        try:
+            return defn.address_str
+        except AttributeError:
+            # jsonpickle restores ranges without running __init__, and
+            # serialised models without the field exist (e.g. the tests'
+            # model.json). Use their cells, like the original code did, in
+            # hashable form.
+            return tuple(map(tuple, defn.cells))
+    return defn.address
+
+
+# Every pickle of protocol 2 or later starts with the PROTO opcode, while
+# JSON documents start with "{".
+_PICKLE_PROTO_OPCODE = pickle.PROTO
+
+
+# Models are read and written in large chunks; the default 8 KiB buffer
+# means thousands of calls for a big model.
+_FILE_BUFFER_SIZE = 1 << 20
+# Level 3 compresses several times faster than gzip's default of 9, and the
+# files only grow by a few percent.
+_GZIP_COMPRESS_LEVEL = 3
+
+
+def _open_model_file(fname, mode):
+    """Open a persisted model file, gzipped if it has a gzip extension."""
+    if os.path.splitext(fname)[-1].lower() in [".gzip", ".gz"]:
+        fp = gzip.GzipFile(fname, mode, compresslevel=_GZIP_COMPRESS_LEVEL)
+        if "r" in mode:
+            return io.BufferedReader(fp, _FILE_BUFFER_SIZE)
+        return io.BufferedWriter(fp, _FILE_BUFFER_SIZE)
+    return open(fname, mode, buffering=_FILE_BUFFER_SIZE)
+
+
+def _decode_json_state(fp):
+    # Decode straight from the file contents so the raw bytes are not
+    # kept alive alongside the decoded object graph.
+    return jsonpickle.decode(
+        fp.read().decode(),
+        keys=True,
+        classes=(
+            xltypes.XLCell,
+            xltypes.XLFormula,
+            xltypes.XLRange,
+            tokenizer.f_token,
+        ),
+    )
 
-    Returns:
-        String hash suitable for cache key, or "empty" if no defined names
-    """
-    if not defined_names_dict:
-        return "empty"
 
-    # Create a deterministic hash from the defined names
-    # Sort items to ensure consistent hashing
-    try:
-        sorted_items = sorted(defined_names_dict.items())
-        content = str(sorted_items)
-        return str(hash(content))
-    except Exception:
-        # Fallback for unhashable items
-        return "complex"
+def _parse_formula(formula_text, defined_names):
+    """Parse a single formula; used by the worker processes of build_code."""
+    return parser.FormulaParser().parse(formula_text, defined_names)
 
 
 def get_formula_cache_stats():
@@ -88,10 +146,43 @@ def clear_formula_cache():
     _parse_formula_cached_local.cache_clear()
 
 
+def set_formula_cache_size(maxsize):
+    """Resize the local formula parsing cache, dropping all cached ASTs.
+
+    ``maxsize=0`` disables caching, ``None`` makes the cache unbounded.
+    """
+    global _parse_formula_cached_local, _parse_formula_cached
+    _parse_formula_cached_local = _parse_formula_cached = lru_cache(
+        maxsize=maxsize
+    )(_parse_formula_cached_local.__wrapped__)
+
+
 # Main cached parser function
 _parse_formula_cached = _parse_formula_cached_local
 
 
+def _iter_range_cells(xl_range):
+    """Lazily yield every cell address of a range, row by row."""
+    return itertools.chain.from_iterable(xl_range.cells)
+
+
+def _copy_cell(cell):
+    """Copy a cell for use in another model.
+
+    Unlike ``copy.deepcopy()`` this does not walk the formula's tokens and
+    AST, which are never mutated after parsing and can be shared. The cell
+    and formula objects themselves are copied, since ``build_code()`` and
+    ``build_ranges()`` assign to their attributes.
+    """
+    new_cell = copy.copy(cell)
+    if type(cell.value) not in _IMMUTABLE_TYPES:
+        new_cell.value = copy.copy(cell.value)
+    new_cell.defined_names = list(cell.defined_names)
+    if cell.formula is not None:
+        new_cell.formula = copy.copy(cell.formula)
+    return new_cell
+
+
 @dataclass
 class Model:
     cells: dict = field(
@@ -112,104 +203,62 @@ class Model:
 
     def set_cell_value(self, address, value):
         """Sets a new value for a specified cell."""
-        if address in self.defined_names:
-            if isinstance(self.defined_names[address], xltypes.XLCell):
-                address = self.defined_names[address].address
-
-        if isinstance(address, str):
-            if address in self.cells:
-                self.cells[address].value = copy.copy(value)
-            else:
-                self.cells[address] = xltypes.XLCell(address, copy.copy(value))
-
-        elif isinstance(address, xltypes.XLCell):
-            if address.address in self.cells:
-                self.cells[address.address].value = value
-            else:
-                self.cells[address.address] = xltypes.XLCell
-                (address.address, value)
-
-        else:
+        # OPTIMIZATION: Normalise the address up front so there is a single
+        # code path.
+        if isinstance(address, xltypes.XLCell):
+            address = address.address
+        elif not isinstance(address, str):
             raise TypeError(
                 f"Cannot set the cell value for an address of type "
                 f"{address}. XLCell or a string is needed."
             )
 
-    def get_cell_value(self, address):
-        if address in self.defined_names:
-            if isinstance(self.defined_names[address], xltypes.XLCell):
-                address = self.defined_names[address].address
+        defn = self.defined_names.get(address)
+        if isinstance(defn, xltypes.XLCell):
+            address = defn.address
 
-        if isinstance(address, str):
-            if address in self.cells:
-                return self.cells[address].value
-            else:
-                logging.debug(
-                    "Trying to get value for cell {address} but that cell "
-                    "doesn't exist."
-                )
-                return 0
-
-        elif isinstance(address, xltypes.XLCell):
-            if address.address in self.cells:
-                return self.cells[address.address].value
-            else:
-                logging.debug(
-                    "Trying to get value for cell {address.address} but "
-                    "that cell doesn't exist"
-                )
-                return 0
+        # OPTIMIZATION: Most cell values are immutable scalars, which don't
+        # need to go through the copy machinery.
+        if type(value) not in _IMMUTABLE_TYPES:
+            value = copy.copy(value)
 
+        cell = self.cells.get(address)
+        if cell is not None:
+            cell.value = value
         else:
+            self.cells[address] = xltypes.XLCell(address, value)
+
+    def get_cell_value(self, address):
+        if isinstance(address, xltypes.XLCell):
+            address = address.address
+        elif not isinstance(address, str):
             raise TypeError(
-                f"Cannot set the cell value for an address of type "
+                f"Cannot get the cell value for an address of type "
                 f"{address}. XLCell or a string is needed."
             )
 
-    def persist_to_json_file(self, fname):
-        """Writes the state to disk.
+        defn = self.defined_names.get(address)
+        if isinstance(defn, xltypes.XLCell):
+            address = defn.address
 
-        Doesn't write the graph directly, but persist all the things that
-        provide the ability to re-create the graph.
-        """
-        output = {
+        cell = self.cells.get(address)
+        if cell is not None:
+            return cell.value
+        logging.debug(
+            "Trying to get value for cell %s but that cell "
+            "doesn't exist.", address
+        )
+        return 0
+
+    def _get_state(self):
+        return {
             "cells": self.cells,
             "defined_names": self.defined_names,
             "formulae": self.formulae,
             "ranges": self.ranges,
         }
 
-        file_open = (
-            gzip.GzipFile
-            if os.path.splitext(fname)[-1].lower() in [".gzip", ".gz"]
-            else open
-        )
-
-        with file_open(fname, "wb") as fp:
-            fp.write(jsonpickle.encode(output, keys=True).encode())
-
-    def construct_from_json_file(self, fname, build_code=False):
-        """Constructs a graph from a state persisted to disk."""
-
-        file_open = (
-            gzip.GzipFile
-            if os.path.splitext(fname)[-1].lower() in [".gzip", ".gz"]
-            else open
-        )
-
-        with file_open(fname, "rb") as fp:
-            json_bytes = fp.read()
-
-        data = jsonpickle.decode(
-            json_bytes,
-            keys=True,
-            classes=(
-                xltypes.XLCell,
-                xltypes.XLFormula,
-                xltypes.XLRange,
-                tokenizer.f_token,
-            ),
-        )
+    def _set_state(self, data, build_code):
         self.cells = data["cells"]
 
         self.defined_names = data["defined_names"]
@@ -219,37 +268,125 @@ class Model:
         if build_code:
             self.build_code()
 
-    def build_code(self):
-        """Define the Python code for all cells in the dict of cells."""
+    def persist_to_json_file(self, fname):
+        """Writes the state to disk.
+
+        Doesn't write the graph directly, but persist all the things that
+        provide the ability to re-create the graph.
+        """
+        output = self._get_state()
 
-        for cell in self.cells:
-            if self.cells[cell].formula is not None:
-                defined_names = {
-                    name: defn.address for name, defn in self.defined_names.items()
-                }
+        # Compact separators keep whitespace out of what is by far the
+        # largest part of the payload: one JSON object per cell.
+        with _open_model_file(fname, "wb") as fp:
+            fp.write(
+                jsonpickle.encode(output, keys=True, separators=(",", ":")).encode()
+            )
 
+    def construct_from_json_file(self, fname, build_code=False):
+        """Constructs a graph from a state persisted to disk."""
+
+        with _open_model_file(fname, "rb") as fp:
+            data = _decode_json_state(fp)
+
+        self._set_state(data, build_code)
+
+    def persist_to_file(self, fname):
+        """Writes the state to disk as a pickle.
+
+        Same content as ``persist_to_json_file()``, but pickling is several
+        times faster and the files are smaller. Only load files from trusted
+        sources, as unpickling can execute arbitrary code.
+        """
+        with _open_model_file(fname, "wb") as fp:
+            pickle.dump(self._get_state(), fp, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def construct_from_file(self, fname, build_code=False):
+        """Constructs a graph from a state persisted to disk.
+
+        Reads files written by ``persist_to_file()`` as well as by
+        ``persist_to_json_file()``; the format is detected from the first
+        byte of the (decompressed) content.
+        """
+        with _open_model_file(fname, "rb") as fp:
+            if fp.peek(1)[:1] == _PICKLE_PROTO_OPCODE:
+                data = pickle.load(fp)
+            else:
+                data = _decode_json_state(fp)
+
+        self._set_state(data, build_code)
+
+    def build_code(self, max_workers=None):
+        """Define the Python code for all cells in the dict of cells.
+
+        Parsing is CPU bound, so with ``max_workers`` greater than 1 the
+        unique formulas are parsed in that many worker processes. This only
+        pays off for workbooks with many thousands of distinct formulas.
+        """
+
+        # OPTIMIZATION: The defined names map is invariant across cells, so
+        # build it once. Its frozenset form is the parser cache key; CPython
+        # caches a frozenset's hash, so every lookup below is O(1).
+        defined_names = {
+            name: _defined_name_address(defn)
+            for name, defn in self.defined_names.items()
+        }
+
+        if max_workers is not None and max_workers > 1:
+            self._build_code_parallel(defined_names, max_workers)
+            return
+
+        defined_names_key = frozenset(defined_names.items())
+
+        # OPTIMIZATION: Copy-pasted formulas share their text, so each unique
+        # text goes through the parser cache once and its AST is shared by
+        # every cell using it. The AST does not depend on the cell's sheet.
+        asts = {}
+        for cell in self.cells.values():
+            formula = cell.formula
+            if formula is None:
+                continue
+
+            ast = asts.get(formula.formula)
+            if ast is None:
                 # OPTIMIZATION: Use cached formula parsing with proper defined_names handling
-                defined_names_hash = _serialize_defined_names(defined_names)
-                self.cells[cell].formula.ast = _parse_formula_cached(
-                    self.cells[cell].formula.formula, defined_names_hash
+                ast = asts[formula.formula] = _parse_formula_cached(
+                    formula.formula, defined_names_key
+                )
+            formula.ast = ast
+
+    def _build_code_parallel(self, defined_names, max_workers):
+        formulas = [
+            cell.formula for cell in self.cells.values() if cell.formula is not None
+        ]
+        formula_texts = list({formula.formula for formula in formulas})
+        chunksize = max(1, len(formula_texts) // (max_workers * 4))
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            asts = dict(
+                zip(
+                    formula_texts,
+                    executor.map(
+                        _parse_formula,
+                        formula_texts,
+                        itertools.repeat(defined_names),
+                        chunksize=chunksize,
+                    ),
                 )
-
-    def __eq__(self, other):
-        cells_comparison = []
-        for self_cell in self.cells:
-            cells_comparison.append(self.cells[self_cell] == other.cells[self_cell])
-
-        defined_names_comparison = []
-        for self_defined_names in self.defined_names:
-            defined_names_comparison.append(
-                self.defined_names[self_defined_names]
-                == other.defined_names[self_defined_names]
             )
 
+        for formula in formulas:
+            formula.ast = asts[formula.formula]
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        # Dict equality runs in C, compares sizes first and stops at the
+        # first mismatch.
         return (
-            self.__class__ == other.__class__
-            and all(cells_comparison)
-            and all(defined_names_comparison)
+            type(self) is type(other)
+            and self.cells == other.cells
+            and self.defined_names == other.defined_names
         )
 
 
@@ -292,24 +429,24 @@ class ModelCompiler:
         return self.model
 
     def read_and_parse_dict(self, input_dict, default_sheet="Sheet1", build_code=True):
-        for item in input_dict:
+        for item, value in input_dict.items():
             if "!" in item:
                 cell_address = item
             else:
-                cell_address = "{}!{}".format(default_sheet, item)
+                cell_address = f"{default_sheet}!{item}"
 
             if (
-                not isinstance(input_dict[item], (float, int))
-                and input_dict[item][0] == "="
+                not isinstance(value, (float, int))
+                and value[0] == "="
             ):
-                formula = xltypes.XLFormula(input_dict[item], sheet_name=default_sheet)
+                formula = xltypes.XLFormula(value, sheet_name=default_sheet)
                 cell = xltypes.XLCell(cell_address, None, formula=formula)
                 self.model.cells[cell_address] = cell
                 self.model.formulae[cell_address] = cell.formula
 
             else:
                 self.model.cells[cell_address] = xltypes.XLCell(
-                    cell_address, input_dict[item]
+                    cell_address, value
                 )
 
         self.build_ranges(default_sheet=default_sheet)
@@ -355,10 +492,10 @@ class ModelCompiler:
                 self.model.cells[defn.address].defined_names.append(name)
 
             elif isinstance(defn, xltypes.XLRange):
-                if any(isinstance(el, list) for el in defn.cells):
-                    for column in defn.cells:
-                        for row_address in column:
-                            self.model.cells[row_address].defined_names.append(name)
+                if defn.ndim == 2:
+                    cells = self.model.cells
+                    for address in _iter_range_cells(defn):
+                        cells[address].defined_names.append(name)
                 else:
                     # programmer error
                     message = "This isn't a dim2 array. {}".format(name)
@@ -378,18 +515,20 @@ class ModelCompiler:
         Key optimizations:
         1. Batch extraction of all ranges first
         2. Deduplication to avoid repeated work
-        3. Parallel processing for independent operations
-        4. Vectorized set operations
-        5. Intelligent caching with pre-allocation
+        3. Vectorized set operations
+        4. Intelligent caching with pre-allocation
+
+        Progress and timings of each phase are logged at DEBUG level.
         """
-        import time
-        from collections import defaultdict
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        if not self.model.formulae:
+            return
 
-        print(
-            f"Starting optimized build_ranges for {len(self.model.formulae)} formulas..."
+        logging.debug(
+            "Starting optimized build_ranges for %d formulas...",
+            len(self.model.formulae),
         )
         start_time = time.time()
+        has_tables = bool(self.model.tables)
 
         def _get_sheet_max_row(sheet_name):
             if sheet_name is None:
@@ -401,206 +540,208 @@ class ModelCompiler:
                 return sheet_max_rows[sheet_name]
             return None
 
+        def _get_sheet_name(address):
+            # Split on the first "!" only; partition is a single scan and
+            # does not build a throwaway list like str.split.
+            sheet, sep, _ = address.partition("!")
+            return sheet if sep else default_sheet
+
         # OPTIMIZATION 1: Batch extract all unique ranges and formulas
-        print("Phase 1: Extracting unique ranges...")
+        logging.debug("Phase 1: Extracting unique ranges...")
         phase1_start = time.time()
 
         unique_ranges = set()
         unique_formulas = set()
-        formula_to_ranges = defaultdict(set)
+        # Formula address -> references (ranges and single cells) it uses.
         formula_metadata = {}
-
-        for formula_addr in self.model.formulae:
-            formula = self.model.formulae[formula_addr]
-            formula_key = f"{formula.sheet_name}|{formula.formula}"
-
-            # Skip already processed formulas (except special cases)
-            if "[#This Row]" not in formula_key and formula_key in unique_formulas:
-                continue
-            unique_formulas.add(formula_key)
+        # Table references recur across many formulas and the tables do not
+        # change while building, so each one is resolved only once. Failed
+        # resolutions are remembered as None.
+        table_ranges = {}
+        # Original table name -> name in the tables dict, filled on demand.
+        table_names = {}
+
+        for formula_addr, formula in self.model.formulae.items():
+            formula_key = (formula.sheet_name, formula.formula)
+
+            # Skip already processed formulas (except special cases).
+            # [#This Row] formulas resolve differently for every cell, so
+            # they are never deduplicated nor tracked in the set.
+            if "[#This Row]" not in formula.formula:
+                if formula_key in unique_formulas:
+                    continue
+                unique_formulas.add(formula_key)
 
             # Store metadata for later processing
-            formula_metadata[formula_addr] = {
-                "formula": formula,
-                "key": formula_key,
-                "ranges": set(),
-            }
+            formula_ranges = formula_metadata[formula_addr] = set()
 
             # Extract all ranges from this formula
             for range_ref in formula.terms:
                 processed_range = range_ref
 
-                # Handle table references
-                if "[" in range_ref and "]" in range_ref:
+                # Handle table references. A single find for the opening
+                # bracket serves both detection and the later scans.
+                lb = range_ref.find("[")
+                if lb != -1 and range_ref.find("]", lb) != -1:
+                    if not has_tables:
+                        # Resolution can only fail without tables.
+                        logging.debug("Skipping table range %s: no tables", range_ref)
+                        continue
+                    this_row = range_ref.find("[#This Row]", lb) != -1
+                    # Only [#This Row] references depend on the formula cell.
+                    table_key = (range_ref, formula_addr if this_row else None)
                     try:
-                        # fake import error
-                        from xlcalculator.utils import resolve_table_ranges
-
-                        table_range = resolve_table_ranges(
-                            range_ref, self.model.tables, formula_addr
-                        )
-                        if "[#This Row]" in range_ref:
-                            processed_range = range_ref.replace(
-                                "[#This Row]", formula_addr
+                        resolved = table_ranges[table_key]
+                    except KeyError:
+                        try:
+                            table_range = utils.resolve_table_ranges(
+                                range_ref, self.model.tables, formula_addr,
+                                table_names
                             )
-                        else:
-                            processed_range = range_ref
-                        unique_ranges.add((processed_range, table_range, "table"))
-                        formula_metadata[formula_addr]["ranges"].add(processed_range)
-                    except Exception as e:
-                        print(f"Skipping table range {range_ref}: {e}")
+                            resolved = (table_range, _get_sheet_name(table_range))
+                        except Exception as e:
+                            logging.debug("Skipping table range %s: %s", range_ref, e)
+                            resolved = None
+                        table_ranges[table_key] = resolved
+                    if resolved is None:
                         continue
 
+                    if this_row:
+                        processed_range = range_ref.replace(
+                            "[#This Row]", formula_addr
+                        )
+                    unique_ranges.add(
+                        (processed_range, resolved[0], "table", resolved[1])
+                    )
+                    formula_ranges.add(processed_range)
+
                 # Handle cell ranges
                 elif ":" in range_ref:
-                    if "!" not in range_ref:
-                        full_range = f"{default_sheet}!{range_ref}"
-                    else:
+                    range_sheet, sep, _ = range_ref.partition("!")
+                    if sep:
                         full_range = range_ref
+                    else:
+                        full_range = f"{default_sheet}!{range_ref}"
+                        range_sheet = default_sheet
 
-                    cur_sheet = (
-                        full_range.split("!")[0] if "!" in full_range else default_sheet
+                    unique_ranges.add(
+                        (full_range, full_range, "range", range_sheet)
                     )
-                    unique_ranges.add((full_range, full_range, "range", cur_sheet))
-                    formula_metadata[formula_addr]["ranges"].add(full_range)
+                    formula_ranges.add(full_range)
 
                 # Handle single cells
                 else:
-                    formula_metadata[formula_addr]["ranges"].add(range_ref)
+                    formula_ranges.add(range_ref)
 
-        print(
-            f"Phase 1 complete: {len(unique_ranges)} unique ranges, {len(unique_formulas)} unique formulas ({time.time() - phase1_start:.2f}s)"
+        logging.debug(
+            "Phase 1 complete: %d unique ranges, %d unique formulas (%.2fs)",
+            len(unique_ranges),
+            len(formula_metadata),
+            time.time() - phase1_start,
         )
 
-        # OPTIMIZATION 2: Parallel range processing
-        print("Phase 2: Building ranges in parallel...")
+        # OPTIMIZATION 2: Batched range construction. XLRange construction
+        # is pure Python and holds the GIL, so it is done serially.
+        logging.debug("Phase 2: Building ranges...")
         phase2_start = time.time()
 
-        # Skip parallel processing if no ranges to process
-        range_results = {}
-        if not unique_ranges:
-            print("No ranges to process, skipping parallel range building...")
-        else:
-
-            def build_single_range(range_data):
-                """Build a single range - suitable for parallel execution"""
-                if len(range_data) == 3:  # table range
-                    range_key, table_range, range_type = range_data
-                    try:
-                        cur_sheet = (
-                            table_range.split("!")[0]
-                            if "!" in table_range
-                            else default_sheet
-                        )
-                        xl_range = xltypes.XLRange(
-                            table_range,
-                            table_range,
-                            max_row=_get_sheet_max_row(cur_sheet),
-                        )
-                        return range_key, xl_range
-                    except Exception:
-                        return range_key, None
-                else:  # regular range
-                    range_key, full_range, range_type, cur_sheet = range_data
-                    try:
-                        xl_range = xltypes.XLRange(
-                            full_range,
-                            full_range,
-                            max_row=_get_sheet_max_row(cur_sheet),
-                        )
-                        return range_key, xl_range
-                    except Exception:
-                        return range_key, None
-
-            # Process ranges in parallel (use ThreadPoolExecutor for I/O bound operations)
-            # Ensure max_workers is always at least 1 to avoid ThreadPoolExecutor error
-            max_workers = max(1, min(8, len(unique_ranges)))
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_range = {
-                    executor.submit(build_single_range, range_data): range_data[0]
-                    for range_data in unique_ranges
-                }
-
-                for future in as_completed(future_to_range):
-                    range_key, xl_range = future.result()
-                    if xl_range is not None:
-                        range_results[range_key] = xl_range
-
-        # Add results to model
-        self.model.ranges.update(range_results)
+        # Ranges go straight into the model; built_ranges only remembers
+        # which ones were created by this call for Phase 3.
+        built_ranges = []
+        for range_key, full_range, range_type, cur_sheet in unique_ranges:
+            # Table ranges were already resolved to a cell range and the
+            # sheet of every range was computed once in Phase 1.
+            try:
+                xl_range = xltypes.XLRange(
+                    full_range,
+                    full_range,
+                    max_row=_get_sheet_max_row(cur_sheet),
+                )
+            except Exception:
+                continue
+            self.model.ranges[range_key] = xl_range
+            built_ranges.append(xl_range)
 
-        print(
-            f"Phase 2 complete: {len(range_results)} ranges built ({time.time() - phase2_start:.2f}s)"
+        logging.debug(
+            "Phase 2 complete: %d ranges built (%.2fs)",
+            len(built_ranges),
+            time.time() - phase2_start,
         )
 
         # OPTIMIZATION 3: Vectorized cell creation and association
-        print("Phase 3: Creating cells and associations...")
+        logging.debug("Phase 3: Creating cells and associations...")
         phase3_start = time.time()
 
-        # Pre-calculate all cell addresses that need to be created
+        # Pre-calculate all cell addresses that need to be created. Range
+        # cells are streamed row by row instead of being copied into a
+        # per-range set that would be kept alive until Phase 4.
         all_cells_to_create = set()
-        range_to_cells = {}
-
-        if range_results:
-            for range_key, xl_range in range_results.items():
-                cell_addresses = set()
-                for row in xl_range.cells:
-                    for cell_addr in row:
-                        cell_addresses.add(cell_addr)
-                        all_cells_to_create.add(cell_addr)
-                range_to_cells[range_key] = cell_addresses
-
-            # Batch create all missing cells
-            existing_cells = set(self.model.cells.keys())
-            cells_to_create = all_cells_to_create - existing_cells
-
-            print(f"Creating {len(cells_to_create)} missing cells...")
-            for cell_addr in cells_to_create:
-                self.model.cells[cell_addr] = xltypes.XLCell(cell_addr, "")
+
+        if built_ranges:
+            for xl_range in built_ranges:
+                all_cells_to_create.update(_iter_range_cells(xl_range))
+
+            # Batch create all missing cells. The difference is taken against
+            # the cells dict directly, so no copy of its keys is needed.
+            cells_to_create = all_cells_to_create.difference(self.model.cells)
+
+            logging.debug("Creating %d missing cells...", len(cells_to_create))
+            self.model.cells.update(
+                {
+                    cell_addr: xltypes.XLCell.new_empty(cell_addr)
+                    for cell_addr in cells_to_create
+                }
+            )
         else:
-            print("No ranges to process, skipping cell creation...")
+            logging.debug("No ranges to process, skipping cell creation...")
             cells_to_create = set()
 
-        print(
-            f"Phase 3 complete: {len(cells_to_create)} cells created ({time.time() - phase3_start:.2f}s)"
+        logging.debug(
+            "Phase 3 complete: %d cells created (%.2fs)",
+            len(cells_to_create),
+            time.time() - phase3_start,
         )
 
         # OPTIMIZATION 4: Batch formula association
-        print("Phase 4: Associating formulas with cells...")
+        logging.debug("Phase 4: Associating formulas with cells...")
         phase4_start = time.time()
 
         if formula_metadata:
-            for formula_addr, metadata in formula_metadata.items():
-                # Collect all associated cells for this formula
+            for formula_addr, formula_ranges in formula_metadata.items():
+                # Collect all associated cells for this formula. Single cell
+                # references seed the set and all ranges are merged into it
+                # with one update call.
                 associated_cells = set()
+                range_sources = []
 
-                for range_ref in metadata["ranges"]:
-                    if range_ref in range_to_cells:
-                        associated_cells.update(range_to_cells[range_ref])
+                for range_ref in formula_ranges:
+                    xl_range = self.model.ranges.get(range_ref)
+                    if xl_range is not None:
+                        range_sources.append(_iter_range_cells(xl_range))
                     else:
                         # Single cell reference
                         associated_cells.add(range_ref)
 
+                associated_cells.update(*range_sources)
+
                 # Assign associations
-                if formula_addr in self.model.cells:
-                    self.model.cells[
-                        formula_addr
-                    ].formula.associated_cells = associated_cells
+                cell = self.model.cells.get(formula_addr)
+                if cell is not None:
+                    cell.formula.associated_cells = associated_cells
 
-                if formula_addr in self.model.defined_names:
-                    self.model.defined_names[
-                        formula_addr
-                    ].formula.associated_cells = associated_cells
+                defn = self.model.defined_names.get(formula_addr)
+                if defn is not None:
+                    defn.formula.associated_cells = associated_cells
 
                 self.model.formulae[formula_addr].associated_cells = associated_cells
         else:
-            print("No formulas to process, skipping formula associations...")
+            logging.debug("No formulas to process, skipping formula associations...")
 
-        total_time = time.time() - start_time
-        print(
-            f"Phase 4 complete: Formula associations done ({time.time() - phase4_start:.2f}s)"
+        logging.debug(
+            "Phase 4 complete: Formula associations done (%.2fs)",
+            time.time() - phase4_start,
         )
-        print("Total processing time", total_time, "seconds.")
+        logging.debug("Total processing time %.2f seconds.", time.time() - start_time)
 
     @staticmethod
     def extract(model, focus):
@@ -608,22 +749,27 @@ class ModelCompiler:
 
         for address in focus:
             if isinstance(address, str) and address in model.cells:
-                extracted_model.cells[address] = copy.deepcopy(model.cells[address])
+                extracted_model.cells[address] = _copy_cell(model.cells[address])
 
             elif isinstance(address, str) and address in model.defined_names:
-                extracted_model.defined_names[address] = defn = copy.deepcopy(
-                    model.defined_names[address]
-                )
+                defn = model.defined_names[address]
+                if isinstance(defn, xltypes.XLCell):
+                    defn = _copy_cell(defn)
+                else:
+                    # The cell matrix of a range is never mutated, so it
+                    # is shared with the source model.
+                    defn = copy.copy(defn)
+                extracted_model.defined_names[address] = defn
 
                 if isinstance(defn, xltypes.XLCell):
-                    extracted_model.cells[defn.address] = copy.deepcopy(
+                    extracted_model.cells[defn.address] = _copy_cell(
                         model.cells[defn.address]
                     )
 
                 elif isinstance(defn, xltypes.XLRange):
                     for row in defn.cells:
                         for column in row:
-                            extracted_model.cells[column] = copy.deepcopy(
+                            extracted_model.cells[column] = _copy_cell(
                                 model.cells[column]
                             )
 
@@ -635,13 +781,13 @@ class ModelCompiler:
                         term in extracted_model.cells
                         and cell.formula != model.cells[addr].formula
                     ):
-                        cell.formula = copy.deepcopy(model.cells[addr].formula)
+                        cell.formula = copy.copy(model.cells[addr].formula)
 
                     elif term not in extracted_model.cells:
                         terms_to_copy.append(term)
 
         for term in terms_to_copy:
-            extracted_model.cells[term] = copy.deepcopy(model.cells[term])
+            extracted_model.cells[term] = _copy_cell(model.cells[term])
 
         extracted_model.build_code()
 
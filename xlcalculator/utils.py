@@ -1,8 +1,10 @@
-import collections
+import itertools
 import re
+import sys
 from openpyxl.utils.cell import COORD_RE, SHEET_TITLE
 from openpyxl.utils.cell import range_boundaries, get_column_letter
 from enum import Enum
+from functools import lru_cache
 
 class TableReferenceError(Exception):
     """Base class for table reference errors"""
@@ -27,6 +29,18 @@ class InvalidItemSpecifierError(TableReferenceError):
 MAX_COL = 18278
 MAX_ROW = 1048576
 
+SHEET_TITLE_RE = re.compile(SHEET_TITLE.strip())
+
+# Column letters indexed by column index - 1, built once at import.
+_COL_LETTERS = tuple(get_column_letter(idx) for idx in range(1, MAX_COL + 1))
+_COL_INDEXES = {letter: idx for idx, letter in enumerate(_COL_LETTERS, 1)}
+
+# Plain relative A1 or A1:B2 references, the overwhelmingly common case.
+SIMPLE_RANGE_RE = re.compile(r'([A-Z]{1,3})([0-9]+)(?::([A-Z]{1,3})([0-9]+))?')
+
+# An escape quote is a ' in front of one of the special characters [ ] ' # @
+COLUMN_ESCAPE_RE = re.compile(r"'(?=[\[\]'#@])")
+
 # Item specifiers in Microsoft Excel structured references
 class ItemSpecifier(str, Enum):
     All = "All"
@@ -35,33 +49,78 @@ class ItemSpecifier(str, Enum):
     ThisRow = "This Row"
     Totals = "Totals" # not supported by our code yet
 
+
+# Item specifier text -> enum member. Specifiers are converted once when a
+# reference is parsed, so the hot comparisons hit the identity fast path.
+_ITEM_SPECIFIERS = {item.value: item for item in ItemSpecifier}
+
+
+@lru_cache(maxsize=1024)
 def resolve_sheet(sheet_str):
+    # Sheet names are interned so that the millions of cells of a large
+    # workbook share a single string object per sheet. A workbook only has
+    # a handful of sheets, so the result is cached and the regex only runs
+    # once per distinct spelling.
     sheet_str = sheet_str.strip()
-    sheet_match = re.match(SHEET_TITLE.strip(), sheet_str + '!')
+    sheet_match = SHEET_TITLE_RE.match(sheet_str + '!')
     if sheet_match is None:
         # Internally, sheets are not properly quoted, so consider the entire
         # string.
-        return sheet_str
+        return sys.intern(sheet_str)
 
-    return sheet_match.group("quoted") or sheet_match.group("notquoted")
+    return sys.intern(
+        sheet_match.group("quoted") or sheet_match.group("notquoted"))
 
 
 def resolve_address(addr):
     # Addresses without sheet name are not supported.
-    sheet_str, addr_str = addr.split('!')
+    sheet_str, sep, addr_str = addr.partition('!')
+    if not sep:
+        raise ValueError(f'Address without a sheet name: {addr}')
     sheet = resolve_sheet(sheet_str)
-    coord_match = COORD_RE.split(addr_str)
-    col, row = coord_match[1:3]
+    # OPTIMIZATION: Plain "A1" coordinates are split by hand; absolute or
+    # otherwise unusual ones go through openpyxl's regex.
+    col = addr_str.rstrip('0123456789')
+    row = addr_str[len(col):]
+    if not (row and len(col) <= 3 and col.isalpha() and col.isascii()):
+        coord_match = COORD_RE.split(addr_str)
+        col, row = coord_match[1:3]
     return sheet, col, row
 
 
-def resolve_ranges(ranges, default_sheet='Sheet1', sheet_max_row=None):
+def _range_boundaries(rng):
+    """Fast version of openpyxl's range_boundaries for plain A1 references.
+
+    Anything else (absolute, lower case or unbound references) is handed to
+    openpyxl.
+    """
+    match = SIMPLE_RANGE_RE.fullmatch(rng)
+    if match is None:
+        return range_boundaries(rng)
+    min_col, min_row, max_col, max_row = match.groups()
+    min_col = _COL_INDEXES[min_col]
+    min_row = int(min_row)
+    if max_col is None:
+        return min_col, min_row, min_col, min_row
+    return min_col, min_row, _COL_INDEXES[max_col], int(max_row)
+
+
+@lru_cache(maxsize=4096)
+def _parse_ranges(ranges, sheet_max_row=None):
+    """Parse a range list into its sheet and bounding rectangles.
+
+    Only the parsed form is cached: the address matrices can be huge and
+    callers own (and may mutate) the lists they get back.
+    """
     sheet = None
-    range_cells = collections.defaultdict(set)
+    # Every range is kept as a (min_row, max_row, min_col, max_col)
+    # rectangle and only expanded into cell addresses at the end.
+    rectangles = []
     for rng in ranges.split(','):
         # Handle sheets in range.
-        if '!' in rng:
-            sheet_str, rng = rng.split('!')
+        sheet_str, sep, cell_rng = rng.partition('!')
+        if sep:
+            rng = cell_rng
             rng_sheet = resolve_sheet(sheet_str)
             if sheet is not None and sheet != rng_sheet:
                 raise ValueError(
@@ -69,7 +128,7 @@ def resolve_ranges(ranges, default_sheet='Sheet1', sheet_max_row=None):
                     f'{sheet}, {rng_sheet}'
                 )
             sheet = rng_sheet
-        min_col, min_row, max_col, max_row = range_boundaries(rng)
+        min_col, min_row, max_col, max_row = _range_boundaries(rng)
 
         # Unbound ranges (e.g., A:A) might not have these set! So use the max row of the sheet with data if available
         min_col = min_col or 1
@@ -78,23 +137,78 @@ def resolve_ranges(ranges, default_sheet='Sheet1', sheet_max_row=None):
         max_row = max_row or sheet_max_row or MAX_ROW
 
         # Excel ranges are boundaries inclusive!
-        for row_idx in range(min_row or 1, max_row + 1):
-            row_cells = range_cells[row_idx]
-            for col_idx in range(min_col, max_col + 1):
-                row_cells.add(col_idx)
+        rectangles.append((min_row, max_row, min_col, max_col))
+    return sheet, tuple(rectangles)
+
+
+def resolve_ranges(ranges, default_sheet='Sheet1', sheet_max_row=None):
+    sheet, rectangles = _parse_ranges(ranges, sheet_max_row)
 
-    # Now convert the internal structure to a matrix of cell addresses.
+    # Now convert the rectangles to a matrix of cell addresses.
     sheet = default_sheet if sheet is None else sheet
     sheet_str = sheet + '!' if sheet else ''
-    return sheet, [
-        [
-            f'{sheet_str}{get_column_letter(col_idx)}{row_idx}'
-            for col_idx in sorted(row_cells)
-        ]
-        for row_idx, row_cells in sorted(range_cells.items())
-    ]
-
-def resolve_table_ranges(ranges, tables: dict[str, any], cur_cell_addr: str | None = None):
+    if len(rectangles) == 1:
+        # OPTIMIZATION: A single rectangle is by far the most common case
+        # and needs no band splitting at all.
+        min_row, max_row, min_col, max_col = rectangles[0]
+        return sheet, _band_cells(
+            sheet_str, min_row, max_row + 1, range(min_col, max_col + 1))
+
+    cells = []
+    for band_start, band_end, columns in _row_bands(rectangles):
+        cells.extend(_band_cells(sheet_str, band_start, band_end, columns))
+    return sheet, cells
+
+
+def _band_cells(sheet_str, start_row, stop_row, columns):
+    """Build the address matrix of rows that all cover the same columns."""
+    # Format the "Sheet!COL" prefix once per column and the row number once
+    # per row, so each address is a single string concatenation.
+    prefixes = [
+        f'{sheet_str}{_COL_LETTERS[col_idx - 1]}' for col_idx in columns]
+    if len(prefixes) == 1:
+        prefix = prefixes[0]
+        return [
+            [prefix + str(row_idx)] for row_idx in range(start_row, stop_row)]
+    cells = []
+    for row_idx in range(start_row, stop_row):
+        row_str = str(row_idx)
+        cells.append([prefix + row_str for prefix in prefixes])
+    return cells
+
+
+def _row_bands(rectangles):
+    """Split rectangles into bands of rows that cover the same columns.
+
+    Yields ``(start_row, stop_row, columns)`` with ``stop_row`` exclusive and
+    ``columns`` the sorted column indices covered by every row of the band.
+    """
+    boundaries = sorted(
+        {row for rect in rectangles for row in (rect[0], rect[1] + 1)})
+    for band_start, band_end in zip(boundaries, boundaries[1:]):
+        intervals = sorted(
+            (min_col, max_col)
+            for min_row, max_row, min_col, max_col in rectangles
+            if min_row <= band_start <= max_row
+        )
+        if not intervals:
+            continue
+        # Merge overlapping and adjacent column intervals.
+        merged = [list(intervals[0])]
+        for min_col, max_col in intervals[1:]:
+            if min_col <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], max_col)
+            else:
+                merged.append([min_col, max_col])
+        # Expand the intervals in C rather than one column at a time.
+        columns = list(itertools.chain.from_iterable(
+            range(min_col, max_col + 1) for min_col, max_col in merged))
+        yield band_start, band_end, columns
+
+
+def resolve_table_ranges(ranges, tables: dict[str, any],
+                         cur_cell_addr: str | None = None,
+                         table_names: dict | None = None):
     """
     Given a structured reference / table reference, return the cell range that it references in the format of "<sheet>!<range>"
     Documentation on syntax rules: https://support.microsoft.com/en-au/office/using-structured-references-with-excel-tables-f5ed2452-2337-4f71-bed3-c8ae6d2b276e
@@ -103,34 +217,25 @@ def resolve_table_ranges(ranges, tables: dict[str, any], cur_cell_addr: str | No
         ranges: The table reference string (e.g., "Table1[Col1]")
         tables: Dictionary of XLTable objects
         cur_cell_addr: Current cell address for #This Row specifier
+        table_names: Optional table name index, see build_table_name_index()
         
     Returns:
         str: Cell range in format "<sheet>!<range>"
     """
     try:
         # Parse the table reference
-        table_range_components = _parse_table_range(ranges)
-        table_specifier_components = _extract_table_specifiers(table_range_components["specifier"])
-        
-        # Process specifiers
-        item_specifiers = []
-        start_col = None
-        end_col = None
-        for table_specifier_component in table_specifier_components:
-            start_col, end_col = _parse_specifier(table_specifier_component, item_specifiers)
-            
-        # Sanitize column names
-        start_col = _sanitize_table_column_name(start_col) if start_col else start_col
-        end_col = _sanitize_table_column_name(end_col) if end_col else end_col
-        
+        table, start_col, end_col, item_specifiers = (
+            _parse_structured_reference(ranges))
+
         # Get and validate table range
         table_range = _get_table_range(
-            table_range_components["table"], 
-            start_col, 
-            end_col, 
-            item_specifiers, 
-            tables, 
-            cur_cell_addr
+            table,
+            start_col,
+            end_col,
+            list(item_specifiers),
+            tables,
+            cur_cell_addr,
+            table_names,
         )
         
         if not table_range:
@@ -138,13 +243,55 @@ def resolve_table_ranges(ranges, tables: dict[str, any], cur_cell_addr: str | No
             
         return table_range
         
+    except TableReferenceError as e:
+        # Keep the specific error type for callers that tell them apart.
+        raise type(e)(f"Error resolving table range: {e}") from e
     except Exception as e:
         raise Exception(f"Error resolving table range: {e}")
 
+
+@lru_cache(maxsize=65536)
+def _parse_structured_reference(ranges: str) -> tuple:
+    """
+    Parse a structured reference into its table name, sanitized start / end
+    column and item specifiers.
+    This only depends on the reference string, so results are cached: the
+    same reference is typically repeated across every row of a table column.
+
+    Args:
+        ranges: The table reference string (e.g., "Table1[Col1]")
+
+    Returns:
+        tuple: (table, start_col, end_col, item_specifiers)
+    """
+    table_range_components = _parse_table_range(ranges)
+    table_specifier_components = _extract_table_specifiers(
+        table_range_components["specifier"])
+
+    # Process specifiers
+    item_specifiers = []
+    start_col = None
+    end_col = None
+    for table_specifier_component in table_specifier_components:
+        start_col, end_col = _parse_specifier(
+            table_specifier_component, item_specifiers)
+
+    # Sanitize column names
+    if start_col:
+        start_col = _sanitize_table_column_name(start_col)
+    if end_col:
+        end_col = _sanitize_table_column_name(end_col)
+
+    return (table_range_components["table"], start_col, end_col,
+            tuple(item_specifiers))
+
+
 def _parse_table_range(term: str) -> dict:
     """
     Given a potential structured reference / table reference, return the sheet, table, and specifier (whatever is inside the outermost [])
-    Uses regex to parse the term
+    The table name ends at the first "[", so plain string searches are
+    enough and the specifier is only scanned later by
+    _extract_table_specifiers.
 
     Args:
         term: The table reference string to parse
@@ -152,27 +299,21 @@ def _parse_table_range(term: str) -> dict:
     Returns:
         dict: Dictionary containing sheet, table, and specifier
     """
-    match = re.match(
-        r"""^(?:(?P<sheet>[^!\[\]]+)!){0,1}   # Optional 'Sheet!'
-            (?P<table>[^\[\]]+)               # Table name
-            \[(?P<specifier>.*)\]$            # Everything inside outermost []
-        """,
-        term,
-        re.VERBOSE
-    )
-    if not match:
+    lb = term.find("[")
+    prefix = term[:lb]
+    specifier = term[lb + 1:-1]
+    if lb <= 0 or not term.endswith("]") or "]" in prefix or "\n" in specifier:
         raise InvalidTableReferenceError("Term doesn't follow structured reference pattern")
-    
-    specifier = match.group("specifier")
-    if specifier is None:
-        raise InvalidTableReferenceError("Unable to extract specifier from term")
-    elif isinstance(specifier, str):
-        specifier = specifier.strip()
 
-    sheet = match.group("sheet")
-    table = match.group("table")
-    if table is None:
-        raise InvalidTableReferenceError("Unable to extract table from term")
+    specifier = specifier.strip()
+
+    # Optional 'Sheet!' in front of the table name. The table name itself may
+    # contain "!" when there is no sheet.
+    sheet = None
+    table = prefix
+    bang = prefix.find("!")
+    if 0 < bang < len(prefix) - 1:
+        sheet, table = prefix[:bang], prefix[bang + 1:]
 
     return {
         "sheet": sheet,
@@ -188,24 +329,23 @@ def _extract_table_specifiers(table_specifier: str) -> list[str]:
     """
     parts = []
     depth = 0
-    current = []
+    start = 0
 
-    for char in table_specifier:
+    # Walk the string once and slice each part out at top-level commas,
+    # rather than rebuilding it character by character.
+    for idx, char in enumerate(table_specifier):
         if char == '[':
             depth += 1
         elif char == ']':
             depth -= 1
-
-        if char == ',' and depth == 0:
-            part = ''.join(current).strip()
+        elif char == ',' and depth == 0:
+            part = table_specifier[start:idx].strip()
             if part.startswith('[') and part.endswith(']'):
                 parts.append(part)
-            current = []
-        else:
-            current.append(char)
+            start = idx + 1
 
     # Add last part
-    part = ''.join(current).strip()
+    part = table_specifier[start:].strip()
     if part.startswith('[') and part.endswith(']'):
         parts.append(part)
 
@@ -227,16 +367,16 @@ def _parse_specifier(specifier: str, item_specifiers: list[str]) -> tuple[str, s
 
     # Case 1: item specifier
     if specifier[0] == "#":
-        item_specifiers.append(specifier[1:]) 
+        # Unknown specifiers are kept as text and rejected by _get_table_range.
+        item_specifiers.append(
+            _ITEM_SPECIFIERS.get(specifier[1:], specifier[1:]))
         return None, None
 
     # Case 2: columnrange
     # We can assume from experiments that the range is always split by "]:[", with no space in between from excel
-    if "]:[" in specifier:
-        start_col, end_col = specifier.split("]:[")
-        start_col = start_col
-        end_col = end_col
-        return start_col, end_col
+    sep_idx = specifier.find("]:[")
+    if sep_idx != -1:
+        return specifier[:sep_idx], specifier[sep_idx + 3:]
     
     # Case 3: single column
     return specifier, specifier
@@ -245,17 +385,16 @@ def _sanitize_table_column_name(column_name: str) -> str:
     """
     Remove escape characters ' from the column name
     """
-    special_chars = ['[', ']', "'", '#', '@']
-    new_column_name = ""
-    for i in range(0, len(column_name)):
-        if column_name[i] == "'":
-            if i < len(column_name) - 1 and column_name[i+1] in special_chars:
-                continue
-        new_column_name += column_name[i]
-    return new_column_name
-
-def _get_table_range(table_name: str, start_col: str | None, end_col: str | None, 
-                    item_specifiers: list[str], tables: dict, cur_cell_addr: str | None = None) -> str | None:
+    # Most column names carry no escapes at all.
+    if "'" not in column_name:
+        return column_name
+    return COLUMN_ESCAPE_RE.sub('', column_name)
+
+
+def _get_table_range(table_name: str, start_col: str | None,
+                     end_col: str | None, item_specifiers: list[str],
+                     tables: dict, cur_cell_addr: str | None = None,
+                     table_names: dict | None = None) -> str | None:
     """
     Given a dictionary of tables, translate the start column, end column, and item specifiers to return the table cell range in the format of "<sheet>!<range>"
     
@@ -266,23 +405,24 @@ def _get_table_range(table_name: str, start_col: str | None, end_col: str | None
         item_specifiers: List of item specifiers (#Headers, #Data, etc.)
         tables: Dictionary of available tables
         cur_cell_addr: Current cell address for #This Row specifier
+        table_names: Optional table name index, see build_table_name_index()
         
     Returns:
         str: Cell range in format "<sheet>!<range>"
     """
-    table_name = _translate_table_name(table_name, tables)
+    table_name = _translate_table_name(table_name, tables, table_names)
+    table = tables[table_name]
     if end_col is None:
         end_col = start_col
 
     # Get table column range
-    table_range = tables[table_name].cell_range
-    min_col, min_row, max_col, max_row = range_boundaries(table_range)
+    min_col, min_row, max_col, max_row = _table_boundaries(table)
 
     # Apply item specifiers, limiting the rows range
     if len(item_specifiers) == 0:
         # Empty specifier means the data part of the table
-        min_row = min_row + tables[table_name].header_row_count
-        max_row = max_row - 1 if tables[table_name].has_totals_row else max_row
+        min_row = min_row + table.header_row_count
+        max_row = max_row - 1 if table.has_totals_row else max_row
     elif ItemSpecifier.All in item_specifiers:
         pass
     else:
@@ -298,22 +438,27 @@ def _get_table_range(table_name: str, start_col: str | None, end_col: str | None
                     if fixed_max_row is not None:
                         raise InvalidTableReferenceError("Headers specifier cannot be used together with Headers / This Row specifiers")
                     fixed_min_row = min_row
-                    temp_max_row = max(temp_max_row, min_row + tables[table_name].header_row_count - 1)
+                    temp_max_row = max(
+                        temp_max_row, min_row + table.header_row_count - 1)
                 case ItemSpecifier.Data:
                     # Data: No Headers and Totals Rows
-                    temp_min_row = min(temp_min_row, min_row + tables[table_name].header_row_count)
-                    temp_max_row = max(temp_max_row, max_row - 1 if tables[table_name].has_totals_row else max_row)
+                    temp_min_row = min(
+                        temp_min_row, min_row + table.header_row_count)
+                    data_max_row = (
+                        max_row - 1 if table.has_totals_row else max_row)
+                    temp_max_row = max(temp_max_row, data_max_row)
                 case ItemSpecifier.ThisRow:
                     # Current row only
                     if cur_cell_addr is None:
                         raise InvalidTableReferenceError("Current cell address is not provided for #This Row item specifier")
                     if fixed_min_row is not None or fixed_max_row is not None:
                         raise InvalidTableReferenceError("This Row specifier cannot be used together with other specifiers")
-                    coor = cur_cell_addr.rsplit("!", 1)[-1]
-                    _, fixed_min_row, _, fixed_max_row = range_boundaries(coor)
+                    coor = cur_cell_addr.rpartition("!")[2]
+                    _, fixed_min_row, _, fixed_max_row = (
+                        _range_boundaries(coor))
                     break
                 case ItemSpecifier.Totals:
-                    if not tables[table_name].has_totals_row:
+                    if not table.has_totals_row:
                         # Should return null ideally
                         raise InvalidTableReferenceError("Table does not have a totals row")
                     if fixed_min_row is not None:
@@ -327,15 +472,64 @@ def _get_table_range(table_name: str, start_col: str | None, end_col: str | None
 
     # Special case: no column range specified, so span all columns
     if start_col is None:
-        return f"{tables[table_name].sheet}!{get_column_letter(min_col)}{min_row}:{get_column_letter(max_col)}{max_row}"
+        return (f"{table.sheet}!{_COL_LETTERS[min_col - 1]}{min_row}:"
+                f"{_COL_LETTERS[max_col - 1]}{max_row}")
 
     # Get column range indexes from column names, limiting column range
-    start_col_index = None
-    end_col_index = None
-    index = min_col
+    column_offsets = _table_column_offsets(table)
+    start_col_index = column_offsets.get(start_col)
+    end_col_index = column_offsets.get(end_col)
+    if start_col_index is not None:
+        start_col_index += min_col
+    if end_col_index is not None:
+        end_col_index += min_col
 
+    if start_col_index is None:
+        raise ColumnNotFoundError(
+            f"Column '{start_col}' not found in table '{table_name}'")
+    if end_col_index is None:
+        raise ColumnNotFoundError(
+            f"Column '{end_col}' not found in table '{table_name}'")
+
+    return (f"{table.sheet}!{_COL_LETTERS[start_col_index - 1]}{min_row}:"
+            f"{_COL_LETTERS[end_col_index - 1]}{max_row}")
+
+
+def _table_boundaries(table) -> tuple:
+    """
+    Return the boundaries of the table's cell range, parsing it only once per
+    table. The cache is rebuilt if the cell range changes.
+    """
+    cached = getattr(table, "_boundaries", None)
+    if cached is None or cached[0] != table.cell_range:
+        cached = (table.cell_range, _range_boundaries(table.cell_range))
+        table._boundaries = cached
+    return cached[1]
+
+
+def _table_column_offsets(table) -> dict:
+    """
+    Return the column offsets of a table, computing them only once per table.
+    The cache is keyed on the column names, so it follows columns that are
+    renamed, added or removed in place.
+    """
+    names = tuple(column.name for column in table.columns)
+    cached = getattr(table, "_column_offsets", None)
+    if cached is None or cached[0] != names:
+        cached = (names, _column_offsets(table.columns))
+        table._column_offsets = cached
+    return cached[1]
+
+
+def _column_offsets(columns) -> dict:
+    """
+    Map every column name to its offset from the first table column.
+    Names that are not unique get a counter appended, the first duplicate
+    being <name>_2.
+    """
+    offsets = {}
     column_name_count = {}
-    for column in tables[table_name].columns:
+    for offset, column in enumerate(columns):
         # Append counter to column name if it's not unique
         column_name = column.name
         if column_name in column_name_count:
@@ -343,30 +537,56 @@ def _get_table_range(table_name: str, start_col: str | None, end_col: str | None
             column_name = f"{column_name}_{column_name_count[column_name]}"
         else:
             column_name_count[column_name] = 1
-        if column_name == start_col:
-            start_col_index = index
-        if column_name == end_col:
-            end_col_index = index
-        index += 1
+        # A renamed duplicate may clash with a real name; the last one wins.
+        offsets[column_name] = offset
+    return offsets
 
-    if start_col_index is None:
-        raise ColumnNotFoundError(f"Column '{start_col}' not found in table '{table_name}'")
-    if end_col_index is None:
-        raise ColumnNotFoundError(f"Column '{end_col}' not found in table '{table_name}'")
-        
-    return f"{tables[table_name].sheet}!{get_column_letter(start_col_index)}{min_row}:{get_column_letter(end_col_index)}{max_row}"
 
-def _translate_table_name(table_name: str, tables: dict) -> str:
+def build_table_name_index(tables: dict) -> dict:
+    """Map original table names to the names of the tables dict.
+
+    Tables are stored as <name>_<sheet>, while formulas use <name>. Owners
+    of a tables dict can keep the index and hand it to
+    `resolve_table_ranges()`, which refreshes it when it is out of date.
+    """
+    index = {}
+    for name, table in tables.items():
+        original_table_name, sep, potential_sheet = name.partition("_")
+        if sep and table.sheet == potential_sheet:
+            # Keep the first match, like a linear scan would.
+            index.setdefault(original_table_name, name)
+    return index
+
+
+def _translate_table_name(table_name: str, tables: dict,
+                          table_names: dict | None = None) -> str:
     """
     Since we're appending _<sheet_name> to the table name in the upload code, and while the excel formula still retains the original table name,
     we need to find the table name that matches the original table name.
+
+    `table_names` is an optional index from `build_table_name_index()`.
     """
     if table_name in tables:
         return table_name
-    else:
+
+    if table_names is None:
         for name, table in tables.items():
-            if "_" in name:
-                original_table_name, potential_sheet = name.split("_", 1)
-                if original_table_name == table_name and table.sheet == potential_sheet:
-                    return name
-    raise TableNotFoundError(f"Table '{table_name}' not found. Available tables: {list(tables.keys())}")
\ No newline at end of file
+            original_table_name, sep, potential_sheet = name.partition("_")
+            if (sep and original_table_name == table_name
+                    and table.sheet == potential_sheet):
+                return name
+    else:
+        # OPTIMIZATION: Look the name up in the owner's index. Check a hit
+        # against the tables, and rebuild the index if it is out of date.
+        name = table_names.get(table_name)
+        table = tables.get(name)
+        if table is not None and table.sheet == name.partition("_")[2]:
+            return name
+        table_names.clear()
+        table_names.update(build_table_name_index(tables))
+        if table_name in table_names:
+            return table_names[table_name]
+
+    raise TableNotFoundError(
+        f"Table '{table_name}' not found. "
+        f"Available tables: {list(tables.keys())}")
@@ -3,7 +3,6 @@ from typing import Tuple
 
 import pandas as pd
 import numpy_financial as npf
-from scipy.optimize import newton
 
 from . import xl, xlerrors, func_xltypes
 
@@ -229,6 +228,10 @@ def _xnpv(rate, values, dates):
 
 
 def _xirr(values, dates, guess=None):
+    # OPTIMIZATION: scipy.optimize takes longer to import than the rest of
+    # the function modules, so only load it when XIRR is used.
+    from scipy.optimize import newton
+
     try:
         return newton(lambda r: _xnpv(r, values, dates), guess, maxiter=100)
 
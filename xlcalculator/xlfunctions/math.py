@@ -3,8 +3,6 @@ import math
 from typing import Tuple, Union
 
 import numpy as np
-import pandas as pd
-from scipy.special import factorial2
 
 from . import xl, xlerrors, xlcriteria, func_xltypes
 
@@ -12,6 +10,62 @@ from . import xl, xlerrors, xlcriteria, func_xltypes
 rand = np.random.rand
 
 
+def _round_significant(value, digits=15):
+    """Round to the 15 significant digits Excel works with."""
+    if value == 0 or not math.isfinite(value):
+        return value
+    return round(value, digits - 1 - math.floor(math.log10(abs(value))))
+
+
+# Trigonometric functions also take arrays, as used by array formulas.
+_XlNumberOrArray = Union[func_xltypes.XlNumber, func_xltypes.XlArray]
+
+
+def _map_array(ufunc, array):
+    """Apply a NumPy ufunc to all items of an array at once.
+
+    Like in Excel, errors are per item: error items are passed through,
+    items that are no numbers become #VALUE! and items outside of the
+    function's domain become #NUM! errors.
+    """
+    items = np.asarray(array)
+    values = np.empty(items.shape, dtype=np.float64)
+    errors = {}
+    for index, item in np.ndenumerate(items):
+        if isinstance(item, xlerrors.ExcelError):
+            errors[index] = item
+            continue
+        try:
+            values[index] = float(item)
+        except xlerrors.ExcelError as err:
+            errors[index] = err
+        except TypeError:
+            errors[index] = xlerrors.ValueExcelError(
+                f'{item!r} is not a number.')
+    with np.errstate(all='ignore'):
+        results = ufunc(values)
+
+    rows = results.tolist()
+    for index, error in errors.items():
+        rows[index[0]][index[1]] = error
+    rows = [
+        [
+            result if not isinstance(result, float) or math.isfinite(result)
+            else xlerrors.NumExcelError(
+                f'{ufunc.__name__}() is not defined for the item.')
+            for result in row
+        ]
+        for row in rows
+    ]
+    # A single value, like a scalar that failed to cast to a number, is
+    # not returned as an array.
+    if items.shape == (1, 1):
+        if isinstance(rows[0][0], xlerrors.ExcelError):
+            raise rows[0][0]
+        return rows[0][0]
+    return func_xltypes.Array(rows)
+
+
 @xl.register()
 @xl.validate_args
 def ABS(
@@ -28,75 +82,95 @@ def ABS(
 @xl.register()
 @xl.validate_args
 def ACOS(
-        number: func_xltypes.XlNumber
-) -> func_xltypes.XlNumber:
+        number: _XlNumberOrArray
+) -> _XlNumberOrArray:
     """Returns the arccosine, or inverse cosine, of a number.
 
     https://support.office.com/en-us/article/
         acos-function-cb73173f-d089-4582-afa1-76e5524b5d5b
     """
-    return np.arccos(float(number))
+    if isinstance(number, func_xltypes.Array):
+        return _map_array(np.arccos, number)
+
+    if number < -1 or number > 1:
+        raise xlerrors.NumExcelError(f'number {number} must be greater than '
+                                     f'or equal to -1 and less than or '
+                                     f'equal to 1')
+
+    return math.acos(float(number))
 
 
 @xl.register()
 @xl.validate_args
 def ACOSH(
-        number: func_xltypes.XlNumber
-) -> func_xltypes.XlNumber:
+        number: _XlNumberOrArray
+) -> _XlNumberOrArray:
     """Returns the inverse hyperbolic cosine of a number.
 
     https://support.office.com/en-us/article/
         acosh-function-e3992cc1-103f-4e72-9f04-624b9ef5ebfe
     """
+    if isinstance(number, func_xltypes.Array):
+        return _map_array(np.arccosh, number)
+
     if number < 1:
         raise xlerrors.NameExcelError(f'number {number} must be greater'
                                       f'than or equal to 1')
 
-    return np.arccosh(float(number))
+    return math.acosh(float(number))
 
 
 @xl.register()
 @xl.validate_args
 def ASIN(
-        number: func_xltypes.XlNumber
-) -> func_xltypes.XlNumber:
+        number: _XlNumberOrArray
+) -> _XlNumberOrArray:
     """Returns the arcsine, or inverse sine, of a number.
 
     https://support.office.com/en-us/article/
         asin-function-81fb95e5-6d6f-48c4-bc45-58f955c6d347
     """
+    if isinstance(number, func_xltypes.Array):
+        return _map_array(np.arcsin, number)
+
     if number < -1 or number > 1:
         raise xlerrors.NumExcelError(f'number {number} must be less than '
                                      f'or equal to -1 or greater ot equal '
                                      f'to 1')
 
-    return np.arcsin(float(number))
+    return math.asin(float(number))
 
 
 @xl.register()
 @xl.validate_args
 def ASINH(
-        number: func_xltypes.XlNumber
-) -> func_xltypes.XlNumber:
+        number: _XlNumberOrArray
+) -> _XlNumberOrArray:
     """Returns the inverse hyperbolic sine of a number.
 
     https://support.office.com/en-us/article/
         asinh-function-4e00475a-067a-43cf-926a-765b0249717c
     """
-    return np.arcsinh(float(number))
+    if isinstance(number, func_xltypes.Array):
+        return _map_array(np.arcsinh, number)
+
+    return math.asinh(float(number))
 
 
 @xl.register()
 @xl.validate_args
 def ATAN(
-        number: func_xltypes.XlNumber
-) -> func_xltypes.XlNumber:
+        number: _XlNumberOrArray
+) -> _XlNumberOrArray:
     """Returns the arctangent, or inverse tangent, of a number.
 
     https://support.office.com/en-us/article/
         atan-function-50746fa8-630a-406b-81d0-4a2aed395543
     """
-    return np.arctan(float(number))
+    if isinstance(number, func_xltypes.Array):
+        return _map_array(np.arctan, number)
+
+    return math.atan(float(number))
 
 
 @xl.register()
@@ -111,7 +185,7 @@ def ATAN2(
     https://support.office.com/en-us/article/
         atan2-function-c04592ab-b9e3-4908-b428-c96b3a565033
     """
-    return np.arctan2(float(x_num), float(y_num))
+    return math.atan2(float(x_num), float(y_num))
 
 
 @xl.register()
@@ -126,6 +200,8 @@ def CEILING(
     https://support.office.com/en-us/article/
         ceiling-function-0a5cd7c8-0720-4f0a-bd2c-c943e510899f
     """
+    number = float(number)
+    significance = float(significance)
 
     if significance == 0:
         return 0
@@ -134,52 +210,34 @@ def CEILING(
         raise xlerrors.NumExcelError('significance below zero and number \
                                       above zero is not allowed')
 
-    number = float(number)
-    significance = float(significance)
-
-    ceiling = significance * math.ceil(number / significance)
+    # OPTIMIZATION: CEILING(x, 1) and CEILING(x, -1) need no division, and
+    # their whole results need no rounding below 15 digits.
+    if abs(significance) == 1 and abs(number) < 1e15:
+        return significance * math.ceil(
+            _round_significant(number * significance))
 
-    # If number is an exact multiple of significance, no rounding occurs
-    if (number % significance) == 0:
-        return ceiling
-
-    quantize_multiplier = str(significance % 1)
-
-    # If number is negative, and significance is negative, the value is
-    # rounded down, away from zero.
-    if number < 0 and significance < 0:
-        result = decimal.Decimal(ceiling)
-        result = result.quantize(decimal.Decimal(quantize_multiplier),
-                                 rounding=decimal.ROUND_DOWN)
-        return float(result)
-
-    # If number is negative, and significance is positive, the value is
-    # rounded up towards zero.
-    if number < 0 < significance:
-        result = decimal.Decimal(ceiling)
-        result = result.quantize(decimal.Decimal(quantize_multiplier),
-                                 rounding=decimal.ROUND_UP)
-        return float(result)
-
-    # Regardless of the sign of number, a value is rounded up when adjusted
-    # away from zero.
-    result = decimal.Decimal(ceiling)
-    result = result.quantize(decimal.Decimal(quantize_multiplier),
-                             rounding=decimal.ROUND_UP)
-    return float(result)
+    # The sign of the ratio takes care of the direction: a positive ratio is
+    # rounded up away from zero, a negative one (negative number, positive
+    # significance) up towards zero. Float noise is removed from the ratio
+    # and the result, e.g. 1.1 / 0.1 == 11.000000000000002.
+    ratio = _round_significant(number / significance)
+    return _round_significant(significance * math.ceil(ratio))
 
 
 @xl.register()
 @xl.validate_args
 def COS(
-        number: func_xltypes.XlNumber
-) -> func_xltypes.XlNumber:
+        number: _XlNumberOrArray
+) -> _XlNumberOrArray:
     """Returns the cosine of the given angle.
 
     https://support.office.com/en-us/article/
         cos-function-0fb808a5-95d6-4553-8148-22aebdce5f05
     """
-    return np.cos(float(number))
+    if isinstance(number, func_xltypes.Array):
+        return _map_array(np.cos, number)
+
+    return math.cos(float(number))
 
 
 @xl.register()
@@ -192,7 +250,10 @@ def COSH(
     https://support.office.com/en-us/article/
         cosh-function-e460d426-c471-43e8-9540-a57ff3b70555
     """
-    return np.cosh(float(number))
+    try:
+        return math.cosh(float(number))
+    except OverflowError:
+        raise xlerrors.NumExcelError(f'COSH({number}) is too large')
 
 
 @xl.register()
@@ -205,7 +266,7 @@ def DEGREES(
     https://support.office.com/en-us/article/
         degrees-function-4d6ec4db-e694-4b94-ace0-1cc3f61f9ba1
     """
-    return np.degrees(float(angle))
+    return math.degrees(float(angle))
 
 
 @xl.register()
@@ -238,7 +299,10 @@ def EXP(
     https://support.office.com/en-us/article/
         exp-function-c578f034-2c45-4c37-bc8c-329660a63abe
     """
-    return np.exp(float(number))
+    try:
+        return math.exp(float(number))
+    except OverflowError:
+        raise xlerrors.NumExcelError(f'EXP({number}) is too large')
 
 
 @xl.register()
@@ -270,7 +334,7 @@ def FACTDOUBLE(
     if number < 0:
         raise xlerrors.NumExcelError('Negative values are not allowed')
 
-    return factorial2(int(number), exact=True)
+    return math.prod(range(int(number), 0, -2))
 
 
 @xl.register()
@@ -285,6 +349,8 @@ def FLOOR(
     https://support.office.com/en-us/article/
         FLOOR-function-14BB497C-24F2-4E04-B327-B0B4DE5A8886
     """
+    number = float(number)
+    significance = float(significance)
 
     if significance < 0 < number:
         raise xlerrors.NumExcelError('number and significance needto have \
@@ -295,6 +361,10 @@ def FLOOR(
     if significance == 0:
         raise xlerrors.DivZeroExcelError()
 
+    # OPTIMIZATION: FLOOR(x, 1) and FLOOR(x, -1) need no division.
+    if abs(significance) == 1:
+        return significance * math.floor(number * significance)
+
     return significance * math.floor(number / significance)
 
 
@@ -324,6 +394,10 @@ def LN(
     https://support.office.com/en-us/article/
         ln-function-81fe1ed7-dac9-4acd-ba1d-07a142c6118f
     """
+    number = float(number)
+    if number <= 0:
+        raise xlerrors.NumExcelError(f'number {number} must be positive')
+
     return math.log(number)
 
 
@@ -351,7 +425,11 @@ def LOG10(
     https://support.office.com/en-us/article/
         log10-function-c75b881b-49dd-44fb-b6f4-37e3486a0211
     """
-    return np.log10(float(number))
+    number = float(number)
+    if number <= 0:
+        raise xlerrors.NumExcelError(f'number {number} must be positive')
+
+    return math.log10(number)
 
 
 @xl.register()
@@ -417,7 +495,16 @@ def POWER(
     https://support.office.com/en-us/article/
         power-function-d3f2908b-56f4-4c3f-895a-07fb519c362a
     """
-    return np.power(number, power)
+    number = float(number)
+    power = float(power)
+    if number == 0 and power < 0:
+        raise xlerrors.DivZeroExcelError()
+    try:
+        return math.pow(number, power)
+    except (ValueError, OverflowError):
+        # e.g. a fractional power of a negative number.
+        raise xlerrors.NumExcelError(
+            f'{number} cannot be raised to the power of {power}')
 
 
 @xl.register()
@@ -430,17 +517,79 @@ def RADIANS(
     https://support.office.com/en-us/article/
         radians-function-ac409508-3d48-45f5-ac02-1497c92de5bf
     """
-    return np.radians(float(angle))
+    return math.radians(float(angle))
 
 
-def _round(number, num_digits, _rounding=decimal.ROUND_HALF_UP):
-    number = decimal.Decimal(str(number))
+# OPTIMIZATION: Precomputed scales for the usual numbers of digits.
+_POW10 = tuple(10.0 ** exponent for exponent in range(16))
+
+
+def _pow10(exponent):
+    if 0 <= exponent < 16:
+        return _POW10[exponent]
+    return 10.0 ** exponent
+
+
+# The largest power of ten that is exact as a float.
+_MAX_EXACT_POW10 = 22
+
+
+def _round_decimal(number, num_digits, rounding):
+    number = decimal.Decimal(repr(number))
     with decimal.localcontext() as dc:
-        dc.rounding = _rounding
-        ans = round(number, int(num_digits))
+        dc.rounding = rounding
+        try:
+            ans = round(number, num_digits)
+        except decimal.InvalidOperation:
+            # More digits than the context holds: the float has far fewer
+            # significant digits, so there is nothing to round.
+            return float(number)
     return float(ans)
 
 
+def _round(number, num_digits, _rounding=decimal.ROUND_HALF_UP):
+    number = float(number)
+    num_digits = int(num_digits)
+    if number == 0 or not math.isfinite(number):
+        return number
+    if num_digits > 308:
+        # Far below float resolution, nothing to round.
+        return number
+    if num_digits < -308:
+        return math.copysign(0.0, number)
+    if abs(num_digits) > _MAX_EXACT_POW10:
+        return _round_decimal(number, num_digits, _rounding)
+
+    # OPTIMIZATION: Round the scaled magnitude with floats. The scaled float
+    # is within a few ULPs of the decimal the user typed (its repr), so the
+    # result is the same as rounding that decimal, unless the value is that
+    # close to a rounding boundary. Only those cases take the exact, but
+    # slow, decimal path, e.g. 1.005 * 100 == 100.49999999999999.
+    scale = _pow10(abs(num_digits))
+    if num_digits >= 0:
+        scaled = abs(number) * scale
+    else:
+        scaled = abs(number) / scale
+    if scaled >= 2 ** 52:
+        return _round_decimal(number, num_digits, _rounding)
+    whole = math.floor(scaled)
+    fraction = scaled - whole
+    margin = 4 * math.ulp(scaled)
+    if _rounding == decimal.ROUND_HALF_UP:
+        if abs(fraction - 0.5) <= margin:
+            return _round_decimal(number, num_digits, _rounding)
+        whole += fraction > 0.5
+    else:
+        if fraction <= margin or 1 - fraction <= margin:
+            return _round_decimal(number, num_digits, _rounding)
+        whole += _rounding == decimal.ROUND_UP
+
+    # Both operands are exact, so the result is correctly rounded.
+    if num_digits >= 0:
+        return math.copysign(whole / scale, number)
+    return math.copysign(whole * scale, number)
+
+
 @xl.register()
 @xl.validate_args
 def ROUND(
@@ -494,7 +643,8 @@ def SIGN(
     https://support.office.com/en-us/article/
         sign-function-109c932d-fcdc-4023-91f1-2dd0e916a1d8
     """
-    return np.sign(float(number))
+    number = float(number)
+    return float((number > 0) - (number < 0))
 
 
 @xl.register()
@@ -507,7 +657,7 @@ def SIN(
     https://support.office.com/en-us/article/
         sin-function-cf0e3432-8b9e-483c-bc55-a76651c95602
     """
-    return float(np.sin(float(number)))
+    return math.sin(float(number))
 
 
 @xl.register()
@@ -520,6 +670,7 @@ def SQRT(
     https://support.office.com/en-us/article/
         sqrt-function-654975c2-05c4-4831-9a24-2c65e4040fdf
     """
+    number = float(number)
     if number < 0:
         raise xlerrors.NumExcelError(f'number {number} must be non-negative')
 
@@ -536,12 +687,17 @@ def SQRTPI(
     https://support.office.com/en-us/article/
         sqrtpi-function-1fb4e63f-9b51-46d6-ad68-b3e7a8b519b4
     """
+    number = float(number)
     if number < 0:
         raise xlerrors.NumExcelError(f'number {number} must be non-negative')
 
     return math.sqrt(number * math.pi)
 
 
+# Above this many items, SUM() trades `math.fsum()` accuracy for speed.
+_FSUM_MAX_ITEMS = 16
+
+
 @xl.register()
 @xl.validate_args
 def SUM(
@@ -556,7 +712,60 @@ def SUM(
     if len(numbers) == 0:
         return 0
 
-    return sum(numbers)
+    # OPTIMIZATION: Add the native values directly; summing the Number
+    # wrappers casts both operands and allocates a Number per addition.
+    values = [number.value for number in numbers]
+    # Short argument lists of floats get the exactly rounded `math.fsum()`
+    # at no extra cost; for long ranges it is several times slower than
+    # `sum()`. Integers are exact already and keep their type.
+    if len(values) <= _FSUM_MAX_ITEMS and not all(
+            type(value) is int for value in values):
+        try:
+            return math.fsum(values)
+        except (OverflowError, ValueError):
+            # An overflow, or inf and -inf; `sum()` returns inf or nan.
+            pass
+    return sum(values)
+
+
+def _flat_numbers(values):
+    """Return a flat range as a float array, if it only holds Numbers."""
+    if all(type(value) is func_xltypes.Number for value in values):
+        return np.array([value.value for value in values], dtype=float)
+    return None
+
+
+def _sum_numbers(values):
+    """Return a flat sum range as a float array.
+
+    Like `Array.cast_to_numbers()`, values that are no numbers count as 0.
+    """
+    numbers = _flat_numbers(values)
+    if numbers is not None:
+        return numbers
+    numbers = []
+    for value in values:
+        try:
+            numbers.append(func_xltypes.Number.cast(value).value)
+        except xlerrors.ExcelError:
+            numbers.append(0.0)
+    return np.array(numbers, dtype=float)
+
+
+def _criteria_mask(check, values, numbers=None):
+    """Evaluate a parsed criteria for every value of a flat range.
+
+    OPTIMIZATION: A range of plain numbers checked against a numeric
+    criteria is compared in one vectorised pass. Pass the range's
+    `_flat_numbers()`, if already known, to avoid converting it twice.
+    """
+    if check.numeric is not None:
+        if numbers is None:
+            numbers = _flat_numbers(values)
+        if numbers is not None:
+            compare, criteria_value = check.numeric
+            return compare(numbers, criteria_value)
+    return np.array([bool(check(value)) for value in values], dtype=bool)
 
 
 @xl.register()
@@ -576,19 +785,21 @@ def SUMIF(
 
     check = xlcriteria.parse_criteria(criteria)
 
+    range = range.flat
+    # OPTIMIZATION: When the range is also the sum range, its numbers are
+    # converted once for both the criteria and the sum.
+    numbers = None
+    if sum_range is None or check.numeric is not None:
+        numbers = _flat_numbers(range)
     if sum_range is None:
-        sum_range = range
+        sum_range = numbers if numbers is not None else _sum_numbers(range)
+    else:
+        sum_range = _sum_numbers(sum_range.flat)
+    mask = _criteria_mask(check, range, numbers)
 
-    range = range.flat
-    sum_range = sum_range.cast_to_numbers().flat
-
-    # zip() will automatically drop any range values that have indexes larger
-    # than sum_range's length.
-    return sum([
-        sval
-        for cval, sval in zip(range, sum_range)
-        if check(cval)
-    ])
+    # Like zip(), drop any values beyond the shorter range.
+    size = min(len(sum_range), len(mask))
+    return float(sum_range[:size][mask[:size]].sum())
 
 
 @xl.register()
@@ -609,28 +820,25 @@ def SUMIFS(
     """
     # WARNING:
     # - wildcards not supported
-    ranges = [criteria_range.flat]
+    criteria_range = criteria_range.flat
+    ranges = [criteria_range]
     checks = [xlcriteria.parse_criteria(criteria)]
-    rangeLen = len(criteria_range.flat)
-    newRange = []
-    idx = 0
-    for item in criteriaAndRanges:
-        if idx == rangeLen:
-            checks.append(xlcriteria.parse_criteria(item))
-            ranges.append(newRange)
-            newRange = []
-            idx = 0
-        else:
-            newRange.append(item)
-            idx += 1
-    sum_range = sum_range.cast_to_numbers().flat
-    # zip() will automatically drop any range values that have indexes larger
-    # than sum_range's length.
-    return sum([
-        sval
-        for cvals, sval in zip(zip(*ranges), sum_range)
-        if all(checkfn(cvals[i]) for i, checkfn in enumerate(checks))
+    rangeLen = len(criteria_range)
+    # The other ranges arrive flattened, each followed by its criteria.
+    # Slice them out; a trailing incomplete range is ignored.
+    step = rangeLen + 1
+    for start in range(0, len(criteriaAndRanges) - rangeLen, step):
+        ranges.append(criteriaAndRanges[start:start + rangeLen])
+        checks.append(
+            xlcriteria.parse_criteria(criteriaAndRanges[start + rangeLen]))
+    sum_range = _sum_numbers(sum_range.flat)
+    # Like zip(), drop any values beyond the shortest range.
+    size = min(len(sum_range), *(len(crange) for crange in ranges))
+    mask = np.logical_and.reduce([
+        _criteria_mask(checkfn, crange[:size])
+        for checkfn, crange in zip(checks, ranges)
     ])
+    return float(sum_range[:size][mask].sum())
 
 
 @xl.register()
@@ -650,18 +858,44 @@ def SUMPRODUCT(
     if array1_shape == (0, 0):
         return 0
 
-    for array in arrays:
-        array_shape = array.shape
-        if array1_shape != array_shape:
-            raise xlerrors.ValueExcelError(
-                f"The shapes of the arrays do not match. Looking "
-                f"for {array1_shape} but given array has {array_shape}")
-        if any(filter(xlerrors.ExcelError.is_error, xl.flatten(array))):
-            raise xlerrors.NaExcelError(
-                "Excel Errors are present in the sumproduct items.")
-
-    sumproduct = pd.concat(arrays, axis=1)
-    return sumproduct.prod(axis=1).sum()
+    if not all(array.shape == array1_shape for array in arrays):
+        array_shape = next(
+            array.shape for array in arrays if array.shape != array1_shape)
+        raise xlerrors.ValueExcelError(
+            f"The shapes of the arrays do not match. Looking "
+            f"for {array1_shape} but given array has {array_shape}")
+
+    # OPTIMIZATION: Multiply the corresponding items of plain float arrays
+    # instead of concatenating DataFrames, which also keeps the product
+    # element-wise for arrays with more than one column. Errors cannot be
+    # converted to floats, so the arrays are only scanned for them when the
+    # conversion fails.
+    try:
+        vectors = [
+            np.asarray(array, dtype=np.float64).ravel() for array in arrays]
+    except (TypeError, xlerrors.ExcelError) as err:
+        for array in arrays:
+            if any(filter(
+                    xlerrors.ExcelError.is_error, np.asarray(array).flat)):
+                raise xlerrors.NaExcelError(
+                    "Excel Errors are present in the sumproduct items.")
+        if isinstance(err, xlerrors.ExcelError):
+            raise
+        raise xlerrors.ValueExcelError(
+            "The sumproduct items must be numbers.")
+
+    if len(vectors) == 1:
+        return float(vectors[0].sum())
+
+    # The last multiplication is fused with the sum by `np.dot()`; any
+    # others reuse a single temporary (the inputs may be views, so they
+    # are never written to).
+    product = vectors[0]
+    if len(vectors) > 2:
+        product = product * vectors[1]
+        for vector in vectors[2:-1]:
+            np.multiply(product, vector, out=product)
+    return float(np.dot(product, vectors[-1]))
 
 
 @xl.register()
@@ -674,7 +908,7 @@ def TAN(
     https://support.office.com/en-us/article/
         tan-function-08851a40-179f-4052-b789-d7f699447401
     """
-    return float(np.tan(float(number)))
+    return math.tan(float(number))
 
 
 @xl.register()
@@ -694,5 +928,6 @@ def TRUNC(
         return math.trunc(number)
 
     num_digits = int(num_digits)
+    scale = _pow10(num_digits)
 
-    return math.trunc(number * 10**num_digits) / 10**num_digits
+    return math.trunc(float(number) * scale) / scale
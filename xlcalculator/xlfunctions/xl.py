@@ -80,23 +80,41 @@ def _safe_validate(vtype, val, name):
 
 
 def validate_args(func):
+    # OPTIMIZATION: Inspect the signature once, not on every call.
+    sig = inspect.signature(func)
+    params = list(sig.parameters.values())
+    var_param = None
+    if params and params[-1].kind == inspect.Parameter.VAR_POSITIONAL:
+        var_param = params.pop()
+    # Plain positional calls, the way the evaluator calls every function,
+    # can skip binding the arguments when the signature is that simple.
+    positional = all(
+        param.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD
+        for param in params)
+    specs = [(param.name, param.annotation) for param in params]
 
     @functools.wraps(func)
     def validate(*args, **kw):
-        sig = inspect.signature(func)
-        bound = sig.bind(*args, **kw)
+        if kw or not positional or len(args) > len(specs) and not var_param:
+            return _validate_bound(func, sig, args, kw)
         # 1. Convert all input parameters to Excel Types.
-        for pname, value in list(bound.arguments.items()):
+        values = []
+        for (pname, annotation), value in zip(specs, args):
             if isinstance(value, xlerrors.ExcelError):
                 return value
             try:
-                bound.arguments[pname] = _validate(
-                    sig.parameters[pname].annotation, value, pname)
+                values.append(_validate(annotation, value, pname))
+            except xlerrors.ExcelError as err:
+                return err
+        if len(args) > len(specs):
+            try:
+                values.extend(_validate(
+                    var_param.annotation, args[len(specs):], var_param.name))
             except xlerrors.ExcelError as err:
                 return err
         # 2. Run the function to compute the result.
         try:
-            res = func(*bound.args, **bound.kwargs)
+            res = func(*values)
         except xlerrors.ExcelError as err:
             # Never crash on Excel errors as we want to store them as the cell
             # value.
@@ -107,6 +125,28 @@ def validate_args(func):
     return validate
 
 
+def _validate_bound(func, sig, args, kw):
+    bound = sig.bind(*args, **kw)
+    # 1. Convert all input parameters to Excel Types.
+    for pname, value in list(bound.arguments.items()):
+        if isinstance(value, xlerrors.ExcelError):
+            return value
+        try:
+            bound.arguments[pname] = _validate(
+                sig.parameters[pname].annotation, value, pname)
+        except xlerrors.ExcelError as err:
+            return err
+    # 2. Run the function to compute the result.
+    try:
+        res = func(*bound.args, **bound.kwargs)
+    except xlerrors.ExcelError as err:
+        # Never crash on Excel errors as we want to store them as the cell
+        # value.
+        return err
+    # 3. Convert the result to an Excel type.
+    return _validate(sig.return_annotation, res, 'return')
+
+
 def flatten(values):
     """Fully recursive flattening."""
     flat = []
@@ -1,5 +1,7 @@
 import re
 
+import numpy
+
 from . import operator, xlerrors, func_xltypes
 
 CRITERIA_REGEX = r'(\W*)(.*)'
@@ -13,8 +15,42 @@ CRITERIA_OPERATORS = {
     '>': operator.OP_GT,
 }
 
+# Vectorised equivalents, only valid when both sides are Numbers.
+NUMERIC_CRITERIA_OPERATORS = {
+    operator.OP_LT: numpy.less,
+    operator.OP_LE: numpy.less_equal,
+    operator.OP_EQ: numpy.equal,
+    operator.OP_NE: numpy.not_equal,
+    operator.OP_GE: numpy.greater_equal,
+    operator.OP_GT: numpy.greater,
+}
+
+
+# Parsed checks, keyed by criteria type and raw value.
+_CRITERIA_CACHE = {}
+_CRITERIA_CACHE_SIZE = 1024
+
 
 def parse_criteria(criteria):
+    # OPTIMIZATION: Workbooks repeat the same criteria over and over, so
+    # reuse the parsed check. The key includes the type, since the Excel
+    # types compare loosely with each other and with native values.
+    try:
+        key = (type(criteria), getattr(criteria, 'value', criteria))
+        check = _CRITERIA_CACHE.get(key)
+    except TypeError:
+        # Unhashable criteria, like arrays.
+        return _parse_criteria(criteria)
+
+    if check is None:
+        check = _parse_criteria(criteria)
+        if len(_CRITERIA_CACHE) >= _CRITERIA_CACHE_SIZE:
+            _CRITERIA_CACHE.clear()
+        _CRITERIA_CACHE[key] = check
+    return check
+
+
+def _parse_criteria(criteria):
 
     if isinstance(criteria, (str, func_xltypes.Text)):
         search = re.search(CRITERIA_REGEX, str(criteria)).group
@@ -41,6 +77,7 @@ def parse_criteria(criteria):
         def check(probe):
             return operator(probe, value)
 
+        check.numeric = _numeric_criteria(operator, value)
         return check
 
     criteria = func_xltypes.ExcelType.cast_from_native(criteria)
@@ -52,4 +89,16 @@ def parse_criteria(criteria):
     def check(x):
         return x == criteria
 
+    check.numeric = _numeric_criteria(CRITERIA_OPERATORS['='], criteria)
     return check
+
+
+def _numeric_criteria(operator, value):
+    """Return the (numpy comparison, float) pair matching a check.
+
+    It lets callers evaluate the criteria over a whole range of Numbers at
+    once. Criteria on anything but a number have no such pair (None).
+    """
+    if not isinstance(value, func_xltypes.Number):
+        return None
+    return NUMERIC_CRITERIA_OPERATORS[operator], float(value.value)
@@ -61,10 +61,24 @@ class XLCell(XLType):
     defined_names: list = field(compare=False, default_factory=list, repr=True)
 
     def __post_init__(self):
+        self._resolve_address()
+
+    def _resolve_address(self):
         self.sheet, self.column, self.row = utils.resolve_address(self.address)
         self.column_index = column_index_from_string(self.column)
         self.row_index = int(self.row)
 
+    @classmethod
+    def new_empty(cls, address):
+        """Create a blank placeholder cell, bypassing the dataclass init."""
+        cell = cls.__new__(cls)
+        cell.address = address
+        cell._resolve_address()
+        cell.value = ""
+        cell.formula = None
+        cell.defined_names = []
+        return cell
+
     def __float__(self):
         return float(self.value)
 
@@ -84,6 +98,8 @@ class XLRange(XLType):
     sheet: str = field(init=False, default="Sheet1", repr=False)
     value: list = field(default=None, repr=True)
     max_row: int | None = field(default=None, repr=True)
+    # resolve_ranges() always produces a matrix of rows.
+    ndim: int = field(init=False, default=2, compare=False, repr=False)
 
     def __post_init__(self):
         if self.name is None:
@@ -102,4 +118,10 @@ class XLTable(XLType):
     cell_range: str = field(default=None)
     columns: list = field(default=None)
     header_row_count: int = field(default=None)
-    has_totals_row: bool = field(default=False)
\ No newline at end of file
+    has_totals_row: bool = field(default=False)
+    # Parsed cell range and column name -> offset map, built on first use
+    # by utils.
+    _boundaries: tuple = field(
+        init=False, default=None, compare=False, repr=False)
+    _column_offsets: tuple = field(
+        init=False, default=None, compare=False, repr=False)